@@ -0,0 +1 @@
+"""Benchmark implementations and notebooks comparing Python and Mojo."""
@@ -1,9 +1,10 @@
 """Mojo Execution Approaches: Comparison Benchmark.
 
-Compares three approaches for running Mojo code:
+Compares four approaches for running Mojo code:
 1. Uncached executor (run_mojo directly)
 2. Cached executor (examples module)
 3. Decorator (@mojo)
+4. Persistent worker (MojoWorker)
 """
 
 import marimo
@@ -14,20 +15,15 @@ app = marimo.App(width="medium")
 
 @app.cell
 def __():
-    import statistics
-    import sys
     import time
     from pathlib import Path
 
     import marimo as mo
+    import numpy as np
 
-    # Add benchmarks and examples to path
     bench_dir = Path(__file__).parent
-    examples_dir = bench_dir.parent / "examples"
-    sys.path.insert(0, str(bench_dir))
-    sys.path.insert(0, str(examples_dir))
 
-    return mo, time, statistics, Path, sys, bench_dir, examples_dir
+    return mo, time, np, Path, bench_dir
 
 
 @app.cell
@@ -36,11 +32,12 @@ def __(mo):
         """
         # Mojo Execution Approaches: Benchmark
         
-        This notebook compares three approaches for running Mojo code from Python:
+        This notebook compares four approaches for running Mojo code from Python:
         
         1. **Uncached executor**: Direct `run_mojo()` - recompiles every time
         2. **Cached executor**: Cached binary execution (examples module)
         3. **Decorator**: `@mojo` decorator - same caching as #2, cleaner syntax
+        4. **Persistent worker**: `MojoWorker` - one long-lived process, calls over pipes
         
         ## Performance expectations
         
@@ -48,43 +45,53 @@ def __(mo):
         - **Cached (first call)**: Slow once (~1-2s), then fast
         - **Cached (subsequent)**: Fast (~10-50ms)
         - **Decorator**: Same as cached (uses same mechanism)
+        - **Worker**: No process start-up per call, only a pipe round trip
         """
     )
     return
 
 
 @app.cell
-def __():
-    # Import all three approaches
-    from mojo_implementations import (
+def __(bench_dir):
+    # Import all four approaches
+    from benchmarks.mojo_implementations import (
         fibonacci as fib_decorator,
     )
-    from mojo_implementations import (
+    from benchmarks.mojo_implementations import (
         is_prime as prime_decorator,
     )
-    from mojo_implementations import (
+    from benchmarks.mojo_implementations import (
         sum_squares as sum_sq_decorator,
     )
-    from mojo_marimo import clear_cache
-    from uncached_executor import (
+    from benchmarks.uncached_executor import (
         fibonacci as fib_uncached,
     )
-    from uncached_executor import (
+    from benchmarks.uncached_executor import (
         is_prime as prime_uncached,
     )
-    from uncached_executor import (
+    from benchmarks.uncached_executor import (
         sum_squares as sum_sq_uncached,
     )
-
     from examples import (
         fibonacci as fib_cached,
     )
+    from examples import (
+        fibonacci_batch as fib_cached_batch,
+    )
     from examples import (
         is_prime as prime_cached,
     )
     from examples import (
         sum_squares as sum_sq_cached,
     )
+    from examples.examples import FIBONACCI_CODE
+    from py_run_mojo import benchmark_mojo, clear_cache, get_worker
+
+    worker = get_worker(str(bench_dir / "worker.mojo"))
+
+    def fib_worker(n):
+        result = worker.call("fibonacci", n)
+        return int(result) if result else 0
 
     return (
         fib_uncached,
@@ -93,10 +100,15 @@ def __():
         fib_cached,
         sum_sq_cached,
         prime_cached,
+        fib_cached_batch,
         fib_decorator,
         sum_sq_decorator,
         prime_decorator,
         clear_cache,
+        benchmark_mojo,
+        FIBONACCI_CODE,
+        worker,
+        fib_worker,
     )
 
 
@@ -107,31 +119,115 @@ def __(mo):
 
 
 @app.cell
-def __(time, statistics):
-    def benchmark_function(func, *args, warmup_runs=0, timed_runs=5):
-        """Benchmark a function with warmup and multiple timed runs."""
-        # Warmup
+def __(time, np):
+    def benchmark_function(func, *args, warmup_runs=0, timed_runs=5, target_s=None):
+        """Benchmark a function with warmup and multiple timed runs.
+
+        The very first call, warmup included, is always reported on its own as
+        ``first_ms``: the cold-call datum that shows whether the binary cache
+        was hit. Without warmup runs, a first sample more than 3x
+        the median of the rest is treated as a one-off compile and dropped
+        from the statistics (reported as ``discarded_ms``). Single-run
+        cold-start measurements are kept as-is.
+
+        With ``target_s``, sampling is adaptive instead of ``timed_runs`` fixed
+        samples: samples are taken until ``target_s`` seconds have elapsed, and
+        the calls per sample double while a sample is under a tenth of the
+        target. Fast calls get many averaged iterations; slow ones stop early.
+        """
+        # Warmup (timed only to capture the first call)
+        first_ns = None
         for _ in range(warmup_runs):
+            start = time.perf_counter_ns()
             func(*args)
-
-        # Timed runs
-        times = []
-        for _ in range(timed_runs):
-            start = time.perf_counter()
-            result = func(*args)
-            elapsed = time.perf_counter() - start
-            times.append(elapsed * 1000)  # Convert to ms
+            elapsed = time.perf_counter_ns() - start
+            if first_ns is None:
+                first_ns = elapsed
+
+        if target_s is None:
+            # Timed runs (integer ns, preallocated so the loop only stores an int)
+            iters_per_sample = 1
+            times = np.empty(timed_runs, dtype=np.int64)
+            for i in range(timed_runs):
+                start = time.perf_counter_ns()
+                result = func(*args)
+                times[i] = time.perf_counter_ns() - start
+        else:
+            # Adaptive runs: tail-double the inner loop until samples are long
+            # enough to resolve, stopping once the time budget is spent
+            target_ns = int(target_s * 1e9)
+            iters_per_sample = 1
+            samples, total_ns = [], 0
+            while total_ns < target_ns:
+                start = time.perf_counter_ns()
+                for _ in range(iters_per_sample):
+                    result = func(*args)
+                elapsed = time.perf_counter_ns() - start
+                total_ns += elapsed
+                samples.append(elapsed / iters_per_sample)
+                if elapsed < target_ns // 10:
+                    iters_per_sample *= 2
+            times = np.asarray(samples)
+        times = times / 1e6  # Convert ns to ms
+        first_ms = times[0] if first_ns is None else first_ns / 1e6
+
+        discarded_ms = None
+        if warmup_runs == 0 and times.size > 2 and times[0] > 3 * np.median(times[1:]):
+            discarded_ms = times[0]
+            times = times[1:]
 
         return {
             "result": result,
-            "mean_ms": statistics.mean(times),
-            "stdev_ms": statistics.stdev(times) if len(times) > 1 else 0,
-            "min_ms": min(times),
-            "max_ms": max(times),
-            "runs": len(times),
+            "mean_ms": times.mean(),
+            "stdev_ms": times.std(ddof=1) if times.size > 1 else 0,
+            "min_ms": times.min(),
+            "max_ms": times.max(),
+            "runs": times.size,
+            "iters_per_sample": iters_per_sample,
+            "first_ms": first_ms,
+            "discarded_ms": discarded_ms,
+        }
+
+    def benchmark_many(funcs, *args, warmup_runs=1, timed_runs=20):
+        """Benchmark several functions interleaved under the same conditions.
+
+        Each round calls every function once (rotating the order so none always
+        runs first), so CPU caches, clock speed and the OS file cache affect
+        all of them alike. Returns ``{name: stats}`` with the same stats as
+        ``benchmark_function``, including each function's ``first_ms``.
+        """
+        names = list(funcs)
+        first_ns = {}
+        for _ in range(warmup_runs):
+            for name in names:
+                start = time.perf_counter_ns()
+                funcs[name](*args)
+                first_ns.setdefault(name, time.perf_counter_ns() - start)
+
+        times = np.empty((len(names), timed_runs), dtype=np.int64)
+        results = {}
+        for i in range(timed_runs):
+            shift = i % len(names)
+            for j in [*range(shift, len(names)), *range(shift)]:
+                start = time.perf_counter_ns()
+                results[names[j]] = funcs[names[j]](*args)
+                times[j, i] = time.perf_counter_ns() - start
+        times = times / 1e6  # Convert ns to ms
+
+        return {
+            name: {
+                "result": results[name],
+                "mean_ms": row.mean(),
+                "stdev_ms": row.std(ddof=1) if row.size > 1 else 0,
+                "min_ms": row.min(),
+                "max_ms": row.max(),
+                "runs": row.size,
+                "first_ms": first_ns[name] / 1e6 if name in first_ns else row[0],
+            }
+            for name, row in zip(names, times, strict=True)
         }
 
-    return (benchmark_function,)
+    return benchmark_function, benchmark_many
 
 
 @app.cell
@@ -171,6 +267,7 @@ def __(
         f"""
         **1. Uncached executor** (recompiles every time)
         - Mean: {bench_uncached["mean_ms"]:.1f}ms ± {bench_uncached["stdev_ms"]:.1f}ms
+        - First call: {bench_uncached["first_ms"]:.1f}ms
         - Result: {bench_uncached["result"]}
         """
     )
@@ -180,7 +277,7 @@ def __(
     mo.md(
         f"""
         **2. Cached executor** (first call - compiles)
-        - Time: {bench_cached_cold["mean_ms"]:.1f}ms
+        - Time: {bench_cached_cold["first_ms"]:.1f}ms
         - Result: {bench_cached_cold["result"]}
         """
     )
@@ -190,7 +287,7 @@ def __(
     mo.md(
         f"""
         **3. Decorator** (first call - compiles)
-        - Time: {bench_decorator_cold["mean_ms"]:.1f}ms
+        - Time: {bench_decorator_cold["first_ms"]:.1f}ms
         - Result: {bench_decorator_cold["result"]}
         """
     )
@@ -207,16 +304,18 @@ def __(mo):
 @app.cell
 def __(
     benchmark_function,
+    benchmark_many,
     fib_uncached,
     fib_cached,
     fib_decorator,
+    fib_worker,
     n,
     mo,
 ):
     mo.md(f"### Testing fibonacci({n}) with warm cache...")
 
     # Uncached (still slow)
-    bench_uncached_warm = benchmark_function(fib_uncached, n, warmup_runs=1, timed_runs=5)
+    bench_uncached_warm = benchmark_function(fib_uncached, n, warmup_runs=1, target_s=0.2)
     mo.md(
         f"""
         **1. Uncached executor** (still recompiles)
@@ -224,8 +323,13 @@ def __(
         """
     )
 
+    # The fast approaches run interleaved so their numbers are directly comparable
+    bench_warm = benchmark_many(
+        {"cached": fib_cached, "decorator": fib_decorator, "worker": fib_worker}, n
+    )
+
     # Cached (now fast!)
-    bench_cached_warm = benchmark_function(fib_cached, n, warmup_runs=1, timed_runs=5)
+    bench_cached_warm = bench_warm["cached"]
     mo.md(
         f"""
         **2. Cached executor** (using cached binary)
@@ -235,7 +339,7 @@ def __(
     )
 
     # Decorator (now fast!)
-    bench_decorator_warm = benchmark_function(fib_decorator, n, warmup_runs=1, timed_runs=5)
+    bench_decorator_warm = bench_warm["decorator"]
     mo.md(
         f"""
         **3. Decorator** (using cached binary)
@@ -244,7 +348,72 @@ def __(
         """
     )
 
-    return bench_uncached_warm, bench_cached_warm, bench_decorator_warm
+    # Worker (process started once, reused for every call)
+    bench_worker_warm = bench_warm["worker"]
+    mo.md(
+        f"""
+        **4. Persistent worker** (one long-lived process)
+        - Mean: {bench_worker_warm["mean_ms"]:.1f}ms ± {bench_worker_warm["stdev_ms"]:.1f}ms
+        - **Speedup vs cached: {bench_cached_warm["mean_ms"] / bench_worker_warm["mean_ms"]:.1f}x**
+        """
+    )
+
+    return (
+        bench_uncached_warm,
+        bench_warm,
+        bench_cached_warm,
+        bench_decorator_warm,
+        bench_worker_warm,
+    )
+
+
+@app.cell
+def __(mo):
+    mo.md("## Compute Time Inside Mojo")
+    return
+
+
+@app.cell
+def __(benchmark_mojo, bench_cached_warm, FIBONACCI_CODE, n, mo):
+    # Timed by the Mojo clock in one process, so this is the computation alone;
+    # everything else in the numbers above is launch and I/O overhead
+    bench_in_mojo = benchmark_mojo(FIBONACCI_CODE, "fibonacci", (n,), runs=10_000)
+
+    if bench_in_mojo is None:
+        mojo_compute_md = "⚠️ In-process benchmark failed (see output above)"
+    else:
+        mojo_compute_md = f"""
+        **fibonacci({n}) inside Mojo** ({bench_in_mojo["runs"]:,} calls, one process)
+        - First call: {bench_in_mojo["first_ms"] * 1e3:.3f}µs
+        - Mean: {bench_in_mojo["mean_ms"] * 1e3:.3f}µs ± {bench_in_mojo["stdev_ms"] * 1e3:.3f}µs
+        - Share of a warm cached call: {bench_in_mojo["mean_ms"] / bench_cached_warm["mean_ms"]:.4%}
+        """
+    mo.md(mojo_compute_md)
+    return bench_in_mojo, mojo_compute_md
+
+
+@app.cell
+def __(mo):
+    mo.md("## Batched Calls")
+    return
+
+
+@app.cell
+def __(benchmark_function, bench_cached_warm, fib_cached_batch, n, mo):
+    # One process computes the whole batch, so start-up is paid once per batch
+    batch_size = 100
+    bench_batch = benchmark_function(fib_cached_batch, [n] * batch_size, warmup_runs=1)
+    batch_per_call_ms = bench_batch["mean_ms"] / batch_size
+
+    mo.md(
+        f"""
+        **Cached executor, {batch_size} inputs per run**
+        - Per batch: {bench_batch["mean_ms"]:.1f}ms ± {bench_batch["stdev_ms"]:.1f}ms
+        - Per result: {batch_per_call_ms:.3f}ms
+        - **Speedup vs one run per input: {bench_cached_warm["mean_ms"] / batch_per_call_ms:.0f}x**
+        """
+    )
+    return bench_batch, batch_per_call_ms, batch_size
 
 
 @app.cell
@@ -254,7 +423,7 @@ def __(mo):
 
 
 @app.cell
-def __(mo, bench_cached_warm, bench_decorator_warm):
+def __(mo, bench_cached_warm, bench_decorator_warm, bench_worker_warm):
     mo.md(
         f"""
         ### Performance Summary
@@ -264,6 +433,18 @@ def __(mo, bench_cached_warm, bench_decorator_warm):
         - Cached: {bench_cached_warm["mean_ms"]:.1f}ms
         - Decorator: {bench_decorator_warm["mean_ms"]:.1f}ms
         
+        The **persistent worker** skips process start-up entirely:
+        - Worker: {bench_worker_warm["mean_ms"]:.1f}ms
+
+        | Approach | First (ms) | Mean (ms) |
+        |----------|-----------:|----------:|
+        | Cached | {bench_cached_warm["first_ms"]:.1f} | {bench_cached_warm["mean_ms"]:.1f} |
+        | Decorator | {bench_decorator_warm["first_ms"]:.1f} | {bench_decorator_warm["mean_ms"]:.1f} |
+        | Worker | {bench_worker_warm["first_ms"]:.1f} | {bench_worker_warm["mean_ms"]:.1f} |
+
+        A first call far above the mean means that run compiled (a cache miss);
+        in a new session it should match the mean if the cache persisted.
+
         ### Recommendations
         
         **Use Uncached Executor when:**
@@ -281,6 +462,14 @@ def __(mo, bench_cached_warm, bench_decorator_warm):
         - Same code runs multiple times
         - Prefer self-documenting code
         - **Best choice for most use cases**
+
+        **Use a Persistent Worker when:**
+        - Calling the same Mojo program many times in a loop
+        - Per-call latency matters more than simplicity
+
+        **Batch inputs when:**
+        - All inputs are known up front
+        - One run can print one result per argument
         """
     )
     return
@@ -4,6 +4,21 @@ These are intentionally simple implementations to provide a fair baseline
 comparison with Mojo. No numpy or other optimised libraries are used.
 """
 
+import os
+from functools import lru_cache
+from itertools import accumulate, cycle
+from math import isqrt
+from operator import mul
+
+# Opt-in memoisation (PY_RUN_MOJO_BENCH_MEMOIZE=1). Repeated identical calls
+# then time a cache lookup rather than the algorithm, so it is off by default.
+MEMOIZE = os.environ.get("PY_RUN_MOJO_BENCH_MEMOIZE") == "1"
+
+# Opt-in lookup tables (PY_RUN_MOJO_BENCH_LUT=1): factorial and fibonacci are
+# precomputed once at import up to LUT_MAX, so each call is a tuple index.
+LUT = os.environ.get("PY_RUN_MOJO_BENCH_LUT") == "1"
+LUT_MAX = 1000
+
 
 def fibonacci(n: int) -> int:
     """Calculate nth Fibonacci number using iterative approach."""
@@ -23,6 +38,17 @@ def sum_squares(n: int) -> int:
     return total
 
 
+def sum_squares_closed(n: int) -> int:
+    """Calculate sum of squares from 1 to n using the closed form n(n+1)(2n+1)/6.
+
+    Not used for the head-to-head comparison: it shows how much an algorithmic
+    change beats any compiler when the loop can be eliminated entirely.
+    """
+    if n < 1:
+        return 0
+    return n * (n + 1) * (2 * n + 1) // 6
+
+
 def is_prime(n: int) -> bool:
     """Check if number is prime using trial division."""
     if n < 2:
@@ -32,15 +58,41 @@ def is_prime(n: int) -> bool:
     if n % 2 == 0:
         return False
 
-    # Check odd divisors up to sqrt(n)
+    # Check odd divisors up to sqrt(n); the bound is computed once so the
+    # interpreted loop does a single comparison instead of a multiply per step
+    limit = isqrt(n)
     i = 3
-    while i * i <= n:
+    while i <= limit:
         if n % i == 0:
             return False
         i += 2
     return True
 
 
+def is_prime_wheel(n: int) -> bool:
+    """Check if number is prime using a 2-3-5 wheel.
+
+    After ruling out 2, 3 and 5, only divisors coprime to 30 are tried
+    (8 of every 30 integers instead of 15 odd ones), roughly halving the
+    trial divisions of ``is_prime``.
+    """
+    if n < 2:
+        return False
+    for d in (2, 3, 5):
+        if n % d == 0:
+            return n == d
+
+    limit = isqrt(n)
+    i = 7
+    for step in cycle((4, 2, 4, 2, 4, 6, 2, 6)):
+        if i > limit:
+            return True
+        if n % i == 0:
+            return False
+        i += step
+    raise AssertionError("unreachable")
+
+
 def factorial(n: int) -> int:
     """Calculate factorial of n."""
     if n <= 1:
@@ -79,3 +131,75 @@ def count_primes(n: int) -> int:
         if is_prime(i):
             count += 1
     return count
+
+
+def count_primes_incremental(n: int) -> int:
+    """Count number of primes up to n, dividing only by primes found so far.
+
+    Trial division like ``count_primes``, but each candidate is tested against
+    the primes up to its square root rather than every odd number.
+    """
+    if n < 2:
+        return 0
+    primes: list[int] = []
+    count = 1  # 2
+    for m in range(3, n + 1, 2):
+        limit = isqrt(m)
+        for p in primes:
+            if p > limit:
+                primes.append(m)
+                count += 1
+                break
+            if m % p == 0:
+                break
+        else:
+            primes.append(m)
+            count += 1
+    return count
+
+
+def count_primes_sieve(n: int) -> int:
+    """Count number of primes up to n with a Sieve of Eratosthenes.
+
+    O(n log log n) instead of trial division's O(n sqrt n); the slice
+    assignments into the bytearray run in CPython's C loop, so it stays
+    within the standard library.
+    """
+    if n < 2:
+        return 0
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, isqrt(n) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, n + 1, i)))
+    return sum(sieve)
+
+
+def _fibonacci_table(max_n: int) -> tuple[int, ...]:
+    """Build (fib(0), ..., fib(max_n)) in a single pass."""
+    table = [0, 1]
+    for _ in range(2, max_n + 1):
+        table.append(table[-1] + table[-2])
+    return tuple(table[: max_n + 1])
+
+
+if LUT:
+    _FACTORIAL = tuple(accumulate(range(1, LUT_MAX + 1), mul, initial=1))
+    _FIBONACCI = _fibonacci_table(LUT_MAX)
+    _factorial_loop, _fibonacci_loop = factorial, fibonacci
+
+    def factorial(n: int) -> int:
+        """Look up factorial of n, computing it only beyond the table."""
+        return _FACTORIAL[n] if 0 <= n <= LUT_MAX else _factorial_loop(n)
+
+    def fibonacci(n: int) -> int:
+        """Look up nth Fibonacci number, computing it only beyond the table."""
+        return _FIBONACCI[n] if 0 <= n <= LUT_MAX else _fibonacci_loop(n)
+
+
+if MEMOIZE:
+    fibonacci = lru_cache(maxsize=None)(fibonacci)
+    sum_squares = lru_cache(maxsize=None)(sum_squares)
+    is_prime = lru_cache(maxsize=None)(is_prime)
+    factorial = lru_cache(maxsize=None)(factorial)
+    count_primes = lru_cache(maxsize=None)(count_primes)
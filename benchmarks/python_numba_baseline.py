@@ -0,0 +1,89 @@
+"""Numba-compiled Python implementations for benchmarking against Mojo.
+
+The same scalar loops as ``python_baseline.py``, compiled to machine code with
+``numba.njit``. Explicit signatures make compilation eager at import, so even
+the warm-up runs of the benchmark never include JIT time, and ``cache=True``
+persists the compiled code in ``__pycache__`` so later sessions skip
+compilation entirely.
+
+Requires the optional ``numba`` dependency (``pip install py-run-mojo[bench]``).
+"""
+
+from functools import lru_cache
+
+from numba import boolean, int64, njit, prange
+
+# Factorial relies on arbitrary-precision ints, which int64 cannot represent,
+# so the pure Python version is re-exported unchanged (memoised if enabled).
+from benchmarks.python_baseline import MEMOIZE, factorial
+
+__all__ = ["fibonacci", "sum_squares", "is_prime", "factorial", "gcd", "count_primes"]
+
+# Shared compile options. boundscheck is pinned off so a NUMBA_BOUNDSCHECK=1
+# environment can't silently slow the baselines; fastmath only matters for
+# float code but keeps the options identical if float kernels are added.
+JIT_OPTIONS = {"cache": True, "fastmath": True, "boundscheck": False}
+
+
+@njit(int64(int64), **JIT_OPTIONS)
+def fibonacci(n):
+    """Calculate nth Fibonacci number using iterative approach."""
+    if n <= 1:
+        return n
+    prev, curr = 0, 1
+    for _ in range(2, n + 1):
+        prev, curr = curr, prev + curr
+    return curr
+
+
+@njit(int64(int64), **JIT_OPTIONS)
+def sum_squares(n):
+    """Calculate sum of squares from 1 to n."""
+    total = 0
+    for i in range(1, n + 1):
+        total += i * i
+    return total
+
+
+@njit(boolean(int64), **JIT_OPTIONS)
+def is_prime(n):
+    """Check if number is prime using trial division."""
+    if n < 2:
+        return False
+    if n == 2:
+        return True
+    if n % 2 == 0:
+        return False
+
+    # Check odd divisors up to sqrt(n)
+    i = 3
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+
+@njit(int64(int64, int64), **JIT_OPTIONS)
+def gcd(a, b):
+    """Calculate greatest common divisor using Euclidean algorithm."""
+    while b:
+        a, b = b, a % b
+    return a
+
+
+@njit(int64(int64), parallel=True, **JIT_OPTIONS)
+def count_primes(n):
+    """Count number of primes up to n, splitting candidates across cores."""
+    count = 0
+    for i in prange(2, n + 1):
+        if is_prime(i):
+            count += 1
+    return count
+
+
+if MEMOIZE:
+    fibonacci = lru_cache(maxsize=None)(fibonacci)
+    sum_squares = lru_cache(maxsize=None)(sum_squares)
+    is_prime = lru_cache(maxsize=None)(is_prime)
+    count_primes = lru_cache(maxsize=None)(count_primes)
@@ -12,84 +12,174 @@ app = marimo.App(width="medium")
 
 @app.cell
 def __():
-    import statistics
-    import sys
     import time
-    from pathlib import Path
 
     import marimo as mo
+    import numpy as np
 
-    # Add benchmarks to path
-    bench_dir = Path(__file__).parent
-    sys.path.insert(0, str(bench_dir))
-
-    from mojo_implementations import (
+    from benchmarks.mojo_implementations import (
         count_primes as mojo_count_primes,
     )
-    from mojo_implementations import (
-        factorial as mojo_factorial,
+    from benchmarks.mojo_implementations import (
+        count_primes_batch as mojo_count_primes_batch,
     )
-    from mojo_implementations import (
-        fibonacci as mojo_fib,
+    from benchmarks.mojo_implementations import (
+        factorial as mojo_factorial,
     )
-    from mojo_implementations import (
-        gcd as mojo_gcd,
+    from benchmarks.mojo_implementations import (
+        factorial_batch as mojo_factorial_batch,
     )
-    from mojo_implementations import (
-        is_prime as mojo_is_prime,
+    from benchmarks.mojo_implementations import (
+        fibonacci as mojo_fib,
     )
-    from mojo_implementations import (
-        sum_squares as mojo_sum_sq,
+    from benchmarks.mojo_implementations import (
+        fibonacci_batch as mojo_fib_batch,
     )
-    from python_baseline import (
-        count_primes as py_count_primes,
+    from benchmarks.mojo_implementations import (
+        gcd as mojo_gcd,
     )
-    from python_baseline import (
-        factorial as py_factorial,
+    from benchmarks.mojo_implementations import (
+        gcd_batch as mojo_gcd_batch,
     )
-    from python_baseline import (
-        fibonacci as py_fib,
+    from benchmarks.mojo_implementations import (
+        is_prime as mojo_is_prime,
     )
-    from python_baseline import (
-        gcd as py_gcd,
+    from benchmarks.mojo_implementations import (
+        is_prime_batch as mojo_is_prime_batch,
     )
-    from python_baseline import (
-        is_prime as py_is_prime,
+    from benchmarks.mojo_implementations import precompile_all
+    from benchmarks.mojo_implementations import (
+        sum_squares as mojo_sum_sq,
     )
-    from python_baseline import (
-        sum_squares as py_sum_sq,
+    from benchmarks.mojo_implementations import (
+        sum_squares_batch as mojo_sum_sq_batch,
     )
 
+    # Prefer the Numba-compiled baselines for an apples-to-apples comparison
+    # with compiled Mojo; fall back to pure Python if numba isn't installed.
+    try:
+        from benchmarks.python_numba_baseline import (
+            count_primes as py_count_primes,
+        )
+        from benchmarks.python_numba_baseline import (
+            factorial as py_factorial,
+        )
+        from benchmarks.python_numba_baseline import (
+            fibonacci as py_fib,
+        )
+        from benchmarks.python_numba_baseline import (
+            gcd as py_gcd,
+        )
+        from benchmarks.python_numba_baseline import (
+            is_prime as py_is_prime,
+        )
+        from benchmarks.python_numba_baseline import (
+            sum_squares as py_sum_sq,
+        )
+
+        py_baseline = "Numba (@njit)"
+    except ImportError:
+        from benchmarks.python_baseline import (
+            count_primes as py_count_primes,
+        )
+        from benchmarks.python_baseline import (
+            factorial as py_factorial,
+        )
+        from benchmarks.python_baseline import (
+            fibonacci as py_fib,
+        )
+        from benchmarks.python_baseline import (
+            gcd as py_gcd,
+        )
+        from benchmarks.python_baseline import (
+            is_prime as py_is_prime,
+        )
+        from benchmarks.python_baseline import (
+            sum_squares as py_sum_sq,
+        )
+
+        py_baseline = "pure Python"
+
+    from benchmarks.python_baseline import LUT as bench_lut
+    from benchmarks.python_baseline import MEMOIZE as bench_memoize
+    from benchmarks.python_baseline import count_primes_incremental as py_count_primes_incremental
+    from benchmarks.python_baseline import count_primes_sieve as py_count_primes_sieve
+    from benchmarks.python_baseline import is_prime_wheel as py_is_prime_wheel
+    from benchmarks.python_baseline import sum_squares_closed as py_sum_sq_closed
+
+    # Build every binary, several at a time, before anything is timed; one call
+    # each then warms the loader and page cache so the first timed section
+    # isn't an outlier. Inputs come from argv, so the argument values don't matter.
+    precompile_all()
+    for _warm in (mojo_fib, mojo_sum_sq, mojo_is_prime, mojo_factorial, mojo_count_primes):
+        _warm(1)
+    mojo_gcd(1, 1)
+    for _warm in (
+        mojo_fib_batch,
+        mojo_sum_sq_batch,
+        mojo_is_prime_batch,
+        mojo_factorial_batch,
+        mojo_count_primes_batch,
+    ):
+        _warm([1])
+    mojo_gcd_batch([(1, 1)])
+
     return (
         mo,
+        np,
         time,
-        statistics,
-        Path,
-        sys,
-        bench_dir,
+        py_baseline,
+        bench_memoize,
+        bench_lut,
         py_fib,
         py_sum_sq,
+        py_sum_sq_closed,
         py_is_prime,
+        py_is_prime_wheel,
         py_factorial,
         py_gcd,
         py_count_primes,
+        py_count_primes_incremental,
+        py_count_primes_sieve,
         mojo_fib,
         mojo_sum_sq,
         mojo_is_prime,
         mojo_factorial,
         mojo_gcd,
         mojo_count_primes,
+        mojo_fib_batch,
+        mojo_sum_sq_batch,
+        mojo_is_prime_batch,
+        mojo_factorial_batch,
+        mojo_gcd_batch,
+        mojo_count_primes_batch,
     )
 
 
 @app.cell
-def __(mo):
+def __(mo, py_baseline, bench_memoize, bench_lut):
+    memo_note = (
+        "**Memoisation is ON** (`PY_RUN_MOJO_BENCH_MEMOIZE=1`): repeated runs hit "
+        "`lru_cache` on both sides, so timings measure call dispatch, not the algorithms."
+        if bench_memoize
+        else ""
+    )
+    if bench_lut:
+        memo_note += (
+            "\n\n**Lookup tables are ON** (`PY_RUN_MOJO_BENCH_LUT=1`): Python "
+            "`factorial` and `fibonacci` are precomputed at import and only index a tuple."
+        )
     mo.md(
-        """
+        f"""
         # Python vs Mojo: Performance Comparison
         
-        This notebook compares pure Python implementations against Mojo implementations
-        for common algorithms. All Python code uses standard library only (no numpy).
+        This notebook compares Python implementations against Mojo implementations
+        for common algorithms. No numpy is used; the scalar loops are compiled with
+        Numba when it is installed (`pip install py-run-mojo[bench]`), otherwise they
+        run as pure Python.
+
+        **Python baseline in use: {py_baseline}**
+        {memo_note}
         
         ## What to expect
         
@@ -98,6 +188,8 @@ def __(mo):
         - **Computational tasks**: Mojo 10-100x faster
         
         The speedup depends on the algorithm complexity and how well Mojo can optimise it.
+        These figures are against pure Python; against Numba both sides are LLVM-compiled,
+        so expect much closer timings.
         """
     )
     return
@@ -110,9 +202,15 @@ def __(mo):
 
 
 @app.cell
-def __(time, statistics):
-    def benchmark_comparison(py_func, mojo_func, *args, warmup=2, runs=10):
-        """Benchmark Python vs Mojo implementations."""
+def __(np, time):
+    def benchmark_comparison(py_func, mojo_func, *args, mojo_batch, warmup=2, runs=10):
+        """Benchmark Python vs Mojo implementations.
+
+        ``mojo_func`` is only used to warm up and check results: all timed Mojo
+        runs happen in a single ``mojo_batch`` call, and the per-run time is
+        the aggregate divided by ``runs``. That is one sample, so there is no
+        spread to report for Mojo.
+        """
 
         # Warmup
         for _ in range(warmup):
@@ -123,30 +221,29 @@ def __(time, statistics):
         if py_result != mojo_result:
             return {"error": f"Results don't match: Python={py_result}, Mojo={mojo_result}"}
 
-        # Benchmark Python
-        py_times = []
-        for _ in range(runs):
-            start = time.perf_counter()
+        # Benchmark Python (integer ns, preallocated so the timed loop only stores an int)
+        py_times = np.empty(runs, dtype=np.int64)
+        for i in range(runs):
+            start = time.perf_counter_ns()
             py_func(*args)
-            elapsed = time.perf_counter() - start
-            py_times.append(elapsed * 1000)  # ms
+            py_times[i] = time.perf_counter_ns() - start
+        py_times = py_times / 1e6  # ns -> ms
 
-        # Benchmark Mojo
-        mojo_times = []
-        for _ in range(runs):
-            start = time.perf_counter()
-            mojo_func(*args)
-            elapsed = time.perf_counter() - start
-            mojo_times.append(elapsed * 1000)  # ms
+        # Benchmark Mojo: every run in one batched subprocess call
+        batch_inputs = [args if len(args) > 1 else args[0]] * runs
+        start = time.perf_counter_ns()
+        batch_results = mojo_batch(batch_inputs)
+        elapsed = time.perf_counter_ns() - start
+        if batch_results != [py_result] * runs:
+            return {"error": f"Batched results don't match: Python={py_result}"}
+        mojo_mean = elapsed / 1e6 / runs  # ms per run
 
-        py_mean = statistics.mean(py_times)
-        mojo_mean = statistics.mean(mojo_times)
+        py_mean = py_times.mean()
 
         return {
             "python_ms": py_mean,
-            "python_std": statistics.stdev(py_times) if len(py_times) > 1 else 0,
+            "python_std": py_times.std(ddof=1) if py_times.size > 1 else 0,
             "mojo_ms": mojo_mean,
-            "mojo_std": statistics.stdev(mojo_times) if len(mojo_times) > 1 else 0,
             "speedup": py_mean / mojo_mean if mojo_mean > 0 else 0,
             "result": py_result,
         }
@@ -161,11 +258,13 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_fib, mojo_fib, mo):
+def __(benchmark_comparison, py_fib, mojo_fib, mojo_fib_batch, mo):
     fib_results = {}
 
     for n in [10, 20, 30, 40]:
-        result = benchmark_comparison(py_fib, mojo_fib, n, warmup=2, runs=10)
+        result = benchmark_comparison(
+            py_fib, mojo_fib, n, warmup=2, runs=10, mojo_batch=mojo_fib_batch
+        )
         fib_results[n] = result
 
         if "error" in result:
@@ -175,7 +274,7 @@ def __(benchmark_comparison, py_fib, mojo_fib, mo):
                 f"""
                 **fibonacci({n})** = {result["result"]}
                 - Python: {result["python_ms"]:.3f}ms ± {result["python_std"]:.3f}ms
-                - Mojo: {result["mojo_ms"]:.3f}ms ± {result["mojo_std"]:.3f}ms
+                - Mojo: {result["mojo_ms"]:.3f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
@@ -189,11 +288,13 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_sum_sq, mojo_sum_sq, mo):
+def __(benchmark_comparison, py_sum_sq, mojo_sum_sq, mojo_sum_sq_batch, mo):
     sum_sq_results = {}
 
     for n in [100, 1_000, 10_000, 100_000]:
-        result = benchmark_comparison(py_sum_sq, mojo_sum_sq, n, warmup=2, runs=10)
+        result = benchmark_comparison(
+            py_sum_sq, mojo_sum_sq, n, warmup=2, runs=10, mojo_batch=mojo_sum_sq_batch
+        )
         sum_sq_results[n] = result
 
         if "error" in result:
@@ -203,13 +304,44 @@ def __(benchmark_comparison, py_sum_sq, mojo_sum_sq, mo):
                 f"""
                 **sum_squares({n:,})** = {result["result"]:,}
                 - Python: {result["python_ms"]:.3f}ms ± {result["python_std"]:.3f}ms
-                - Mojo: {result["mojo_ms"]:.3f}ms ± {result["mojo_std"]:.3f}ms
+                - Mojo: {result["mojo_ms"]:.3f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
     return sum_sq_results, n, result
 
 
+@app.cell
+def __(mo, np, py_sum_sq_closed, sum_sq_results, time):
+    closed_form_lines = []
+
+    for _n, _loop_result in sum_sq_results.items():
+        if "error" in _loop_result:
+            continue
+
+        assert py_sum_sq_closed(_n) == _loop_result["result"]
+        _closed_times = np.empty(10, dtype=np.int64)
+        for _i in range(_closed_times.size):
+            _start = time.perf_counter_ns()
+            py_sum_sq_closed(_n)
+            _closed_times[_i] = time.perf_counter_ns() - _start
+        _closed_ms = _closed_times.mean() / 1e6
+
+        closed_form_lines.append(
+            f"| {_n:,} | {_loop_result['python_ms']:.3f}ms | {_loop_result['mojo_ms']:.3f}ms "
+            f"| {_closed_ms:.4f}ms |"
+        )
+
+    mo.md(
+        "### Loop vs closed form\n\n"
+        "`n(n+1)(2n+1)/6` removes the loop altogether: an algorithmic change "
+        "beats any compiler.\n\n"
+        "| n | Python loop | Mojo loop | Python closed form |\n"
+        "|---|---|---|---|\n" + "\n".join(closed_form_lines)
+    )
+    return (closed_form_lines,)
+
+
 @app.cell
 def __(mo):
     mo.md("## Prime Number Testing")
@@ -217,7 +349,7 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_is_prime, mojo_is_prime, mo):
+def __(benchmark_comparison, py_is_prime, mojo_is_prime, mojo_is_prime_batch, mo):
     prime_results = {}
 
     test_numbers = [
@@ -228,7 +360,9 @@ def __(benchmark_comparison, py_is_prime, mojo_is_prime, mo):
     ]
 
     for n, desc in test_numbers:
-        result = benchmark_comparison(py_is_prime, mojo_is_prime, n, warmup=2, runs=10)
+        result = benchmark_comparison(
+            py_is_prime, mojo_is_prime, n, warmup=2, runs=10, mojo_batch=mojo_is_prime_batch
+        )
         prime_results[n] = result
 
         if "error" in result:
@@ -238,13 +372,44 @@ def __(benchmark_comparison, py_is_prime, mojo_is_prime, mo):
                 f"""
                 **is_prime({n:,})** ({desc}) = {result["result"]}
                 - Python: {result["python_ms"]:.3f}ms ± {result["python_std"]:.3f}ms
-                - Mojo: {result["mojo_ms"]:.3f}ms ± {result["mojo_std"]:.3f}ms
+                - Mojo: {result["mojo_ms"]:.3f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
     return desc, n, prime_results, result, test_numbers
 
 
+@app.cell
+def __(mo, np, py_is_prime_wheel, prime_results, time):
+    wheel_lines = []
+
+    for _n, _trial_result in prime_results.items():
+        if "error" in _trial_result:
+            continue
+
+        assert py_is_prime_wheel(_n) == _trial_result["result"]
+        _wheel_times = np.empty(10, dtype=np.int64)
+        for _i in range(_wheel_times.size):
+            _start = time.perf_counter_ns()
+            py_is_prime_wheel(_n)
+            _wheel_times[_i] = time.perf_counter_ns() - _start
+        _wheel_ms = _wheel_times.mean() / 1e6
+
+        wheel_lines.append(
+            f"| {_n:,} | {_trial_result['python_ms']:.3f}ms | {_trial_result['mojo_ms']:.3f}ms "
+            f"| {_wheel_ms:.3f}ms |"
+        )
+
+    mo.md(
+        "### Odd divisors vs a 2-3-5 wheel\n\n"
+        "Skipping divisors that share a factor with 30 tries 8 of every 30 "
+        "candidates instead of 15.\n\n"
+        "| n | Python odd divisors | Mojo odd divisors | Python wheel |\n"
+        "|---|---|---|---|\n" + "\n".join(wheel_lines)
+    )
+    return (wheel_lines,)
+
+
 @app.cell
 def __(mo):
     mo.md("## Factorial")
@@ -252,11 +417,13 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_factorial, mojo_factorial, mo):
+def __(benchmark_comparison, py_factorial, mojo_factorial, mojo_factorial_batch, mo):
     fact_results = {}
 
     for n in [10, 50, 100, 500]:
-        result = benchmark_comparison(py_factorial, mojo_factorial, n, warmup=2, runs=10)
+        result = benchmark_comparison(
+            py_factorial, mojo_factorial, n, warmup=2, runs=10, mojo_batch=mojo_factorial_batch
+        )
         fact_results[n] = result
 
         if "error" in result:
@@ -273,7 +440,7 @@ def __(benchmark_comparison, py_factorial, mojo_factorial, mo):
                 f"""
                 **factorial({n})** = {display}
                 - Python: {result["python_ms"]:.3f}ms ± {result["python_std"]:.3f}ms
-                - Mojo: {result["mojo_ms"]:.3f}ms ± {result["mojo_std"]:.3f}ms
+                - Mojo: {result["mojo_ms"]:.3f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
@@ -287,7 +454,7 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_gcd, mojo_gcd, mo):
+def __(benchmark_comparison, py_gcd, mojo_gcd, mojo_gcd_batch, mo):
     gcd_results = {}
 
     test_pairs = [
@@ -298,7 +465,9 @@ def __(benchmark_comparison, py_gcd, mojo_gcd, mo):
     ]
 
     for a, b, desc in test_pairs:
-        result = benchmark_comparison(py_gcd, mojo_gcd, a, b, warmup=2, runs=10)
+        result = benchmark_comparison(
+            py_gcd, mojo_gcd, a, b, warmup=2, runs=10, mojo_batch=mojo_gcd_batch
+        )
         gcd_results[(a, b)] = result
 
         if "error" in result:
@@ -308,7 +477,7 @@ def __(benchmark_comparison, py_gcd, mojo_gcd, mo):
                 f"""
                 **gcd({a:,}, {b:,})** ({desc}) = {result["result"]:,}
                 - Python: {result["python_ms"]:.3f}ms ± {result["python_std"]:.3f}ms
-                - Mojo: {result["mojo_ms"]:.3f}ms ± {result["mojo_std"]:.3f}ms
+                - Mojo: {result["mojo_ms"]:.3f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
@@ -322,11 +491,18 @@ def __(mo):
 
 
 @app.cell
-def __(benchmark_comparison, py_count_primes, mojo_count_primes, mo):
+def __(benchmark_comparison, py_count_primes, mojo_count_primes, mojo_count_primes_batch, mo):
     count_results = {}
 
     for n in [100, 1_000, 10_000]:
-        result = benchmark_comparison(py_count_primes, mojo_count_primes, n, warmup=1, runs=5)
+        result = benchmark_comparison(
+            py_count_primes,
+            mojo_count_primes,
+            n,
+            warmup=1,
+            runs=5,
+            mojo_batch=mojo_count_primes_batch,
+        )
         count_results[n] = result
 
         if "error" in result:
@@ -336,13 +512,51 @@ def __(benchmark_comparison, py_count_primes, mojo_count_primes, mo):
                 f"""
                 **count_primes({n:,})** = {result["result"]:,} primes
                 - Python: {result["python_ms"]:.1f}ms ± {result["python_std"]:.1f}ms
-                - Mojo: {result["mojo_ms"]:.1f}ms ± {result["mojo_std"]:.1f}ms
+                - Mojo: {result["mojo_ms"]:.1f}ms per call (batched mean)
                 - **Speedup: {result["speedup"]:.1f}x**
                 """
             )
     return count_results, n, result
 
 
+@app.cell
+def __(mo, np, py_count_primes_incremental, py_count_primes_sieve, count_results, time):
+    def _mean_ms(func, n, runs=5):
+        times = np.empty(runs, dtype=np.int64)
+        for i in range(runs):
+            start = time.perf_counter_ns()
+            func(n)
+            times[i] = time.perf_counter_ns() - start
+        return times.mean() / 1e6
+
+    sieve_lines = []
+
+    for _n, _trial_result in count_results.items():
+        if "error" in _trial_result:
+            continue
+
+        assert py_count_primes_incremental(_n) == _trial_result["result"]
+        assert py_count_primes_sieve(_n) == _trial_result["result"]
+        _incremental_ms = _mean_ms(py_count_primes_incremental, _n)
+        _sieve_ms = _mean_ms(py_count_primes_sieve, _n)
+
+        sieve_lines.append(
+            f"| {_n:,} | {_trial_result['python_ms']:.2f}ms | {_trial_result['mojo_ms']:.2f}ms "
+            f"| {_incremental_ms:.2f}ms | {_sieve_ms:.3f}ms |"
+        )
+
+    mo.md(
+        "### Trial division vs smarter algorithms\n\n"
+        "Dividing only by the primes found so far skips most candidate divisors, "
+        "and a `bytearray` Sieve of Eratosthenes is O(n log log n) with its "
+        "strided writes done in C, so plain Python closes much of the gap.\n\n"
+        "| n | Python trial division | Mojo trial division | Python prime divisors "
+        "| Python sieve |\n"
+        "|---|---|---|---|---|\n" + "\n".join(sieve_lines)
+    )
+    return (sieve_lines,)
+
+
 @app.cell
 def __(mo):
     mo.md("## Summary")
@@ -350,21 +564,22 @@ def __(mo):
 
 
 @app.cell
-def __(mo, fib_results, sum_sq_results, prime_results, fact_results, count_results):
-    # Collect all speedups
-    all_speedups = []
-
-    for results in [fib_results, sum_sq_results, prime_results, fact_results, count_results]:
-        for result in results.values():
-            if "speedup" in result and result["speedup"] > 0:
-                all_speedups.append(result["speedup"])
-
-    if all_speedups:
-        import statistics
+def __(mo, np, fib_results, sum_sq_results, prime_results, fact_results, count_results):
+    # Collect all speedups into one array, aggregated with vectorised reductions
+    all_speedups = np.array(
+        [
+            result["speedup"]
+            for results in [fib_results, sum_sq_results, prime_results, fact_results, count_results]
+            for result in results.values()
+            if result.get("speedup", 0) > 0
+        ]
+    )
 
-        avg_speedup = statistics.mean(all_speedups)
-        min_speedup = min(all_speedups)
-        max_speedup = max(all_speedups)
+    avg_speedup = min_speedup = max_speedup = None
+    if all_speedups.size:
+        avg_speedup = all_speedups.mean()
+        min_speedup = all_speedups.min()
+        max_speedup = all_speedups.max()
 
         mo.md(
             f"""
@@ -397,7 +612,7 @@ def __(mo, fib_results, sum_sq_results, prime_results, fact_results, count_resul
             - When development speed > execution speed
             """
         )
-    return all_speedups, avg_speedup, max_speedup, min_speedup, statistics
+    return all_speedups, avg_speedup, max_speedup, min_speedup
 
 
 @app.cell
@@ -23,7 +23,7 @@ fn fibonacci(n: Int) -> Int:
 fn main():
     print(fibonacci({n}))
 """
-    result = run_mojo(mojo_code)
+    result = run_mojo(mojo_code, use_cache=False)
     return int(result) if result else 0
 
 
@@ -39,7 +39,7 @@ fn sum_squares(n: Int) -> Int:
 fn main():
     print(sum_squares({n}))
 """
-    result = run_mojo(mojo_code)
+    result = run_mojo(mojo_code, use_cache=False)
     return int(result) if result else 0
 
 
@@ -53,7 +53,7 @@ fn is_prime(n: Int) -> Bool:
         return True
     if n % 2 == 0:
         return False
-    
+
     var i: Int = 3
     while i * i <= n:
         if n % i == 0:
@@ -64,5 +64,5 @@ fn is_prime(n: Int) -> Bool:
 fn main():
     print(is_prime({n}))
 """
-    result = run_mojo(mojo_code)
+    result = run_mojo(mojo_code, use_cache=False)
     return result == "True" if result else False
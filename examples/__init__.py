@@ -1,5 +1,19 @@
 """Example Mojo functions for demonstration."""
 
-from examples.examples import fibonacci, is_prime, sum_squares
+from examples.examples import (
+    fibonacci,
+    fibonacci_batch,
+    is_prime,
+    is_prime_batch,
+    sum_squares,
+    sum_squares_batch,
+)
 
-__all__ = ["fibonacci", "sum_squares", "is_prime"]
+__all__ = [
+    "fibonacci",
+    "sum_squares",
+    "is_prime",
+    "fibonacci_batch",
+    "sum_squares_batch",
+    "is_prime_batch",
+]
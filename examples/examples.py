@@ -4,27 +4,17 @@ These are convenience wrappers that demonstrate how to use the executor
 for common computational tasks.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path when run as script
-if __name__ == "__main__":
-    src_path = Path(__file__).parent.parent / "src"
-    sys.path.insert(0, str(src_path))
-
 from py_run_mojo.executor import run_mojo
 
+# Templates read their inputs from argv, so each compiles to one cached binary
+# that is reused for every argument instead of one binary per value. main()
+# prints one result per argument, so a whole batch shares one process.
+# Output is parsed straight from bytes: int() accepts ASCII digits as bytes,
+# so decoding stdout to str first would only add a copy.
 
-def fibonacci(n: int) -> int:
-    """Calculate Fibonacci number via cached Mojo binary.
+FIBONACCI_CODE = """
+from sys import argv
 
-    Args:
-        n: The Fibonacci number to calculate
-
-    Returns:
-        The nth Fibonacci number
-    """
-    code = f"""
 fn fibonacci(n: Int) -> Int:
     if n <= 1:
         return n
@@ -36,46 +26,30 @@ fn fibonacci(n: Int) -> Int:
         curr = next_val
     return curr
 
-fn main():
-    print(fibonacci({n}))
+fn main() raises:
+    var args = argv()
+    for i in range(1, len(args)):
+        print(fibonacci(atol(args[i])))
 """
-    result = run_mojo(code)
-    return int(result) if result else 0
-
 
-def sum_squares(n: int) -> int:
-    """Calculate sum of squares 1² + 2² + ... + n² via cached Mojo binary.
+SUM_SQUARES_CODE = """
+from sys import argv
 
-    Args:
-        n: Calculate sum up to this number
-
-    Returns:
-        The sum of squares from 1 to n
-    """
-    code = f"""
 fn sum_squares(n: Int) -> Int:
     var total: Int = 0
     for i in range(1, n + 1):
         total += i * i
     return total
 
-fn main():
-    print(sum_squares({n}))
+fn main() raises:
+    var args = argv()
+    for i in range(1, len(args)):
+        print(sum_squares(atol(args[i])))
 """
-    result = run_mojo(code)
-    return int(result) if result else 0
 
+IS_PRIME_CODE = """
+from sys import argv
 
-def is_prime(n: int) -> bool:
-    """Check if number is prime via cached Mojo binary.
-
-    Args:
-        n: The number to check
-
-    Returns:
-        True if n is prime, False otherwise
-    """
-    code = f"""
 fn is_prime(n: Int) -> Bool:
     if n < 2:
         return False
@@ -90,11 +64,95 @@ fn is_prime(n: Int) -> Bool:
         i += 2
     return True
 
-fn main():
-    print(is_prime({n}))
+fn main() raises:
+    var args = argv()
+    for i in range(1, len(args)):
+        print(is_prime(atol(args[i])))
 """
-    result = run_mojo(code)
-    return result == "True" if result else False
+
+
+def fibonacci(n: int) -> int:
+    """Calculate Fibonacci number via cached Mojo binary.
+
+    Args:
+        n: The Fibonacci number to calculate
+
+    Returns:
+        The nth Fibonacci number
+    """
+    result = run_mojo(FIBONACCI_CODE, extra_args=[str(n)], raw_output=True)
+    return int(result) if result else 0
+
+
+def sum_squares(n: int) -> int:
+    """Calculate sum of squares 1² + 2² + ... + n² via cached Mojo binary.
+
+    Args:
+        n: Calculate sum up to this number
+
+    Returns:
+        The sum of squares from 1 to n
+    """
+    result = run_mojo(SUM_SQUARES_CODE, extra_args=[str(n)], raw_output=True)
+    return int(result) if result else 0
+
+
+def is_prime(n: int) -> bool:
+    """Check if number is prime via cached Mojo binary.
+
+    Args:
+        n: The number to check
+
+    Returns:
+        True if n is prime, False otherwise
+    """
+    result = run_mojo(IS_PRIME_CODE, extra_args=[str(n)], raw_output=True)
+    return result.rstrip() == b"True" if result else False
+
+
+def fibonacci_batch(ns: list[int]) -> list[int]:
+    """Calculate several Fibonacci numbers in one run of the cached binary.
+
+    Args:
+        ns: The Fibonacci numbers to calculate
+
+    Returns:
+        The Fibonacci number for each input, in order
+    """
+    if not ns:
+        return []
+    result = run_mojo(FIBONACCI_CODE, extra_args=[str(n) for n in ns], raw_output=True)
+    return [int(line) for line in result.splitlines()] if result else []
+
+
+def sum_squares_batch(ns: list[int]) -> list[int]:
+    """Calculate several sums of squares in one run of the cached binary.
+
+    Args:
+        ns: The upper bounds to sum up to
+
+    Returns:
+        The sum of squares for each input, in order
+    """
+    if not ns:
+        return []
+    result = run_mojo(SUM_SQUARES_CODE, extra_args=[str(n) for n in ns], raw_output=True)
+    return [int(line) for line in result.splitlines()] if result else []
+
+
+def is_prime_batch(ns: list[int]) -> list[bool]:
+    """Check several numbers for primality in one run of the cached binary.
+
+    Args:
+        ns: The numbers to check
+
+    Returns:
+        Whether each input is prime, in order
+    """
+    if not ns:
+        return []
+    result = run_mojo(IS_PRIME_CODE, extra_args=[str(n) for n in ns], raw_output=True)
+    return [line == b"True" for line in result.splitlines()] if result else []
 
 
 if __name__ == "__main__":
@@ -114,5 +172,8 @@ if __name__ == "__main__":
     print(f"Sum squares 1-20: {sum_squares(20)}")
     print(f"Is 23 prime? {is_prime(23)}")
 
+    print("\n=== Batched call (one process for all inputs) ===")
+    print(f"Primes among 10-20: {is_prime_batch(list(range(10, 21)))}")
+
     print()
     cache_stats()
@@ -0,0 +1,153 @@
+"""Shared utilities for Mojo GPU puzzle notebooks.
+
+The marimo and Jupyter utility modules re-export these helpers and add only
+their environment-specific display functions.
+"""
+
+import os
+from functools import cache, lru_cache
+from pathlib import Path
+
+__all__ = [
+    "assemble_puzzle_program",
+    "load_puzzle_fragments",
+    "suggest_puzzle_cli_filename",
+    "save_puzzle_kernel",
+    "save_puzzle_program",
+    "visualise_threads",
+]
+
+# Puzzle directories live alongside this module
+_BASE = Path(__file__).parent
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a fragment, re-reading only when its modification time changes."""
+    return Path(path_str).read_text()
+
+
+def _read_fragment(path: Path) -> str:
+    # Cells re-run on every UI change; a stat is much cheaper than a re-read
+    return _read_cached(str(path), os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _read_bytes_cached(path_str: str, mtime_ns: int) -> bytes:
+    """Like :func:`_read_cached`, but keeps the raw bytes for writing back out."""
+    return Path(path_str).read_bytes()
+
+
+@cache
+def _problem_dir(problem: str) -> Path:
+    """Return the directory holding a puzzle's ``.mojo`` fragments."""
+    return _BASE / problem / "mojo"
+
+
+def load_puzzle_fragments(problem: str) -> tuple[str, str, str]:
+    """Load setup, kernel, and main fragments for a given puzzle.
+
+    ``problem`` should be an identifier like ``"p01"``.
+
+    Files are expected under ``notebooks/gpu_puzzles/<problem>/mojo/`` with
+    the following names::
+
+        <problem>_setup.mojo
+        <problem>_kernel.mojo
+        <problem>_main.mojo
+
+    Returns
+    -------
+    (setup_code, kernel_code, main_code)
+    """
+
+    base = _problem_dir(problem)
+    setup_path = base / f"{problem}_setup.mojo"
+    kernel_path = base / f"{problem}_kernel.mojo"
+    main_path = base / f"{problem}_main.mojo"
+
+    setup_code = _read_fragment(setup_path)
+    kernel_code = _read_fragment(kernel_path)
+    main_code = _read_fragment(main_path)
+
+    return setup_code, kernel_code, main_code
+
+
+@lru_cache(maxsize=16)
+def assemble_puzzle_program(setup_code: str, kernel_code: str, main_code: str) -> str:
+    """Join the three fragments into one Mojo program.
+
+    Cached, since the read-only setup and main fragments never change and an
+    edited kernel often returns to an earlier state.
+    """
+
+    return f"{setup_code}\n\n{kernel_code}\n\n{main_code}"
+
+
+def suggest_puzzle_cli_filename(problem: str) -> str:
+    """Return a suggested filename for saving a puzzle's Mojo program."""
+
+    return f"{problem}_solution.mojo"
+
+
+def save_puzzle_program(
+    problem: str,
+    code: str,
+    filename: str | None = None,
+) -> Path:
+    """Save edited code for a puzzle to a ``.mojo`` file and return the path.
+
+    If ``filename`` is not provided, :func:`suggest_puzzle_cli_filename` is
+    used to generate one inside the puzzle's directory.
+    """
+
+    base = _problem_dir(problem)
+    if filename is None:
+        filename = suggest_puzzle_cli_filename(problem)
+
+    out_path = base / filename
+    out_path.write_text(code)
+    return out_path
+
+
+def save_puzzle_kernel(
+    problem: str,
+    kernel_code: str,
+    filename: str | None = None,
+) -> Path:
+    """Save the puzzle's program with an edited kernel and return the path.
+
+    Writes the same program as :func:`save_puzzle_program` with the assembled
+    code, but only the kernel is encoded: the read-only setup and main
+    fragments are copied from their cached file bytes.
+    """
+
+    base = _problem_dir(problem)
+    if filename is None:
+        filename = suggest_puzzle_cli_filename(problem)
+
+    setup_path = base / f"{problem}_setup.mojo"
+    main_path = base / f"{problem}_main.mojo"
+
+    out_path = base / filename
+    with out_path.open("wb") as f:
+        f.write(_read_bytes_cached(str(setup_path), os.stat(setup_path).st_mtime_ns))
+        f.write(f"\n\n{kernel_code}\n\n".encode())
+        f.write(_read_bytes_cached(str(main_path), os.stat(main_path).st_mtime_ns))
+    return out_path
+
+
+def visualise_threads(num_blocks: int, threads_per_block: int) -> None:
+    """Print a simple mapping from (block, thread) to linear index.
+
+    Useful in both marimo and Jupyter notebooks for building GPU intuition.
+    """
+
+    # One write for the whole table rather than a print per thread
+    print(
+        "\n".join(
+            f"block {b:2d}, thread {t:2d} -> index {b * threads_per_block + t:3d}"
+            for b in range(num_blocks)
+            for t in range(threads_per_block)
+        )
+    )
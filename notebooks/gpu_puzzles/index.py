@@ -30,9 +30,9 @@ def _():
     ## Notebook layout
 
     Each puzzle (or small group of related puzzles) lives in its own
-    notebook under `notebooks/gpu_puzzles/`, following this pattern:
+    directory under `notebooks/gpu_puzzles/`, following this pattern:
 
-    - `NN_short_title.py` (zero-padded puzzle number)
+    - `pNN/pNN_short_title.py` (zero-padded puzzle number)
     - Header with puzzle link & summary
     - Mojo kernel + driver code cells (you paste or adapt from the
       official puzzle repo)
@@ -49,16 +49,16 @@ def _(mo):
     import pathlib
 
     base = pathlib.Path(__file__).parent
-    puzzle_files = sorted(p for p in base.glob("[0-9][0-9]_*.py") if p.name != "index.py")
+    puzzle_files = sorted(base.glob("p[0-9][0-9]/p[0-9][0-9]_*.py"))
 
     rows = []
     for p in puzzle_files:
         number, rest = p.stem.split("_", 1)
         title = rest.replace("_", " ")
-        rows.append((number, title, p.name))
+        rows.append((number, title, p.relative_to(base).as_posix()))
 
     if not rows:
-        mo.md("No GPU puzzle notebooks found yet. Start by creating `01_hello_threads.py`.")
+        mo.md("No GPU puzzle notebooks found yet. Start by creating `p01/p01_hello_threads.py`.")
     else:
         lines = ["| # | Notebook | File |", "|---|----------|------|"]
         for num, title, fname in rows:
@@ -47,21 +47,23 @@ def _(mo):
 def _():
     import marimo as mo
     from gpu_puzzles_utils_marimo import (
+        assemble_puzzle_program,
         load_puzzle_fragments,
         run_puzzle_with_marimo,
-        save_puzzle_program,
+        save_puzzle_kernel,
     )
     from py_run_mojo import run_mojo, get_mojo_version
 
     problem_id = "p01"
     return (
+        assemble_puzzle_program,
         get_mojo_version,
         load_puzzle_fragments,
         mo,
         problem_id,
         run_mojo,
         run_puzzle_with_marimo,
-        save_puzzle_program,
+        save_puzzle_kernel,
     )
 
 
@@ -167,15 +169,8 @@ def _(mo):
 
 
 @app.cell
-def _(kernel_editor, mo, mojo_main_code, mojo_setup_code):
-
-    mojo_code = "\n\n".join(
-        [
-            mojo_setup_code,
-            kernel_editor.value,
-            mojo_main_code,
-        ]
-    )
+def _(assemble_puzzle_program, kernel_editor, mo, mojo_main_code, mojo_setup_code):
+    mojo_code = assemble_puzzle_program(mojo_setup_code, kernel_editor.value, mojo_main_code)
 
     # Optional: inspect the full Mojo program that will be sent to `run_mojo`.
     # You can copy-paste this into a standalone `.mojo` file if you want to
@@ -215,11 +210,11 @@ def _(mo):
 
 
 @app.cell
-def _(mo, mojo_code, problem_id, save_puzzle_program):
+def _(kernel_editor, mo, problem_id, save_puzzle_kernel):
     """Save the current Mojo program to a `.mojo` file for use on the CLI."""
 
     def save_code() -> None:
-        path = save_puzzle_program(problem_id, mojo_code)
+        path = save_puzzle_kernel(problem_id, kernel_editor.value)
         mo.callout(
             f"Saved current kernel to `{path}`. You can run it with `mojo {path}`.",
             kind="info",
@@ -6,9 +6,10 @@ Use alongside https://puzzles.modular.com/puzzle_02/puzzle_02.html.
 import marimo
 
 from gpu_puzzles_utils_marimo import (
+    assemble_puzzle_program,
     load_puzzle_fragments,
     run_puzzle_with_marimo,
-    save_puzzle_program,
+    save_puzzle_kernel,
 )
 from py_run_mojo import run_mojo, get_mojo_version
 
@@ -52,13 +53,14 @@ def _():
 
     problem_id = "p02"
     return (
+        assemble_puzzle_program,
         get_mojo_version,
         load_puzzle_fragments,
         mo,
         problem_id,
         run_mojo,
         run_puzzle_with_marimo,
-        save_puzzle_program,
+        save_puzzle_kernel,
     )
 
 
@@ -146,12 +148,8 @@ def _(mo):
 
 
 @app.cell
-def _(kernel_editor, mo, setup_code, main_code):
-    mojo_code = "\n\n".join([
-        setup_code,
-        kernel_editor.value,
-        main_code,
-    ])
+def _(assemble_puzzle_program, kernel_editor, mo, setup_code, main_code):
+    mojo_code = assemble_puzzle_program(setup_code, kernel_editor.value, main_code)
 
     try:
         expander = mo.expander("Show entire Mojo program")
@@ -188,11 +186,11 @@ def _(mo):
 
 
 @app.cell
-def _(mo, mojo_code, problem_id, save_puzzle_program):
+def _(kernel_editor, mo, problem_id, save_puzzle_kernel):
     """Save the current Mojo program to a `.mojo` file for use on the CLI."""
 
     def save_code() -> None:
-        path = save_puzzle_program(problem_id, mojo_code)
+        path = save_puzzle_kernel(problem_id, kernel_editor.value)
         mo.callout(
             f"Saved current kernel to `{path}`. You can run it with `mojo {path}`.",
             kind="info",
@@ -45,11 +45,11 @@ print(f"Inside circle: {inside_small.sum():,} points")
 # ## Visualise Small Sample
 
 # %%
-# Convert numpy arrays for plotting
-x_inside = x_small[inside_small == 1]
-y_inside = y_small[inside_small == 1]
-x_outside = x_small[inside_small == 0]
-y_outside = y_small[inside_small == 0]
+# Split points with one boolean mask and its negation
+inside_mask = inside_small.astype(bool, copy=False)
+outside_mask = ~inside_mask
+x_inside, y_inside = x_small[inside_mask], y_small[inside_mask]
+x_outside, y_outside = x_small[outside_mask], y_small[outside_mask]
 
 fig = go.Figure()
 
@@ -9,21 +9,25 @@
 # @mojo
 # def my_func(n: int) -> int:
 #     '''
+#     from sys import argv
+#
 #     fn my_func(n: Int) -> Int:
 #         return n * n
 #
-#     fn main():
-#         print(my_func({{n}}))
+#     fn main() raises:
+#         print(my_func(atol(argv()[1])))
 #     '''
 #     ...
 #
 # result = my_func(10)  # Returns: 100
 # ```
 #
-# Use `{{parameter}}` for substitution.
+# Arguments reach `main()` as command-line arguments, so one compiled
+# binary serves every input. A `{{parameter}}` placeholder substitutes the
+# value into the source instead, but compiles once per distinct value.
 
 # %%
-from mojo_marimo import get_mojo_version, mojo
+from py_run_mojo import get_mojo_version, mojo
 
 print(f"Mojo version: {get_mojo_version()}")
 
@@ -35,6 +39,8 @@ print(f"Mojo version: {get_mojo_version()}")
 @mojo
 def fibonacci(n: int) -> int:
     """
+    from sys import argv
+
     fn fibonacci(n: Int) -> Int:
         if n <= 1:
             return n
@@ -46,8 +52,8 @@ def fibonacci(n: int) -> int:
             curr = next_val
         return curr
 
-    fn main():
-        print(fibonacci({{n}}))
+    fn main() raises:
+        print(fibonacci(atol(argv()[1])))
     """
     ...
 
@@ -64,14 +70,16 @@ print(f"fibonacci(20) = {fibonacci(20):,}")
 @mojo
 def sum_squares(n: int) -> int:
     """
+    from sys import argv
+
     fn sum_squares(n: Int) -> Int:
         var total: Int = 0
         for i in range(1, n + 1):
             total += i * i
         return total
 
-    fn main():
-        print(sum_squares({{n}}))
+    fn main() raises:
+        print(sum_squares(atol(argv()[1])))
     """
     ...
 
@@ -88,6 +96,8 @@ print(f"sum_squares(10) = {result}  # 1² + 2² + ... + 10²")
 @mojo
 def is_prime(n: int) -> bool:
     """
+    from sys import argv
+
     fn is_prime(n: Int) -> Bool:
         if n < 2:
             return False
@@ -104,8 +114,8 @@ def is_prime(n: int) -> bool:
 
         return True
 
-    fn main():
-        print(is_prime({{n}}))
+    fn main() raises:
+        print(is_prime(atol(argv()[1])))
     """
     ...
 
@@ -117,11 +127,52 @@ for n in test_numbers:
     status = "✅ prime" if result else "❌ not prime"
     print(f"{n}: {status}")
 
+# %% [markdown]
+# ## Example 4: Persistent Worker
+#
+# Even with a cached binary, each call starts a new process. With
+# `worker=True` the binary is started once and kept running: each call
+# writes its arguments as one stdin line and reads one result line back,
+# so repeated calls cost a pipe round trip instead of a process start.
+# `main()` loops over `input()` until stdin closes.
+
+
+# %%
+@mojo(worker=True)
+def fibonacci_worker(n: int) -> int:
+    """
+    fn fibonacci(n: Int) -> Int:
+        if n <= 1:
+            return n
+        var prev: Int = 0
+        var curr: Int = 1
+        for _ in range(2, n + 1):
+            var next_val = prev + curr
+            prev = curr
+            curr = next_val
+        return curr
+
+    fn main():
+        # Answer one request per stdin line until the notebook closes it
+        while True:
+            try:
+                print(fibonacci(atol(input())), flush=True)
+            except:
+                break
+    """
+    ...
+
+
+# One process answers every call; batch() pipelines all the requests
+print(f"fibonacci_worker(30) = {fibonacci_worker(30):,}")
+print(f"last five of batch(1..30) = {fibonacci_worker.batch(range(1, 31))[-5:]}")
+
 # %% [markdown]
 # ## Performance Characteristics
 #
 # - **First call**: ~1-2 seconds (compiles Mojo code)
 # - **Subsequent calls**: ~10-50ms (uses cached binary)
+# - **Worker calls** (`worker=True`): a pipe round trip, no process start
 # - **Cache location**: `~/.mojo_cache/binaries/`
 #
 # The decorator pattern provides clean Python-like syntax while maintaining Mojo performance through intelligent caching.
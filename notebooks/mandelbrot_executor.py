@@ -7,8 +7,11 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     import marimo as mo
+    import numpy as np
+
+    from py_run_mojo import run_mojo
 
-    return (mo,)
+    return mo, np, run_mojo
 
 
 @app.cell
@@ -27,22 +30,17 @@ def _(mo):
     return
 
 
-@app.cell
-def _(mo):
-    import numpy as np
-    from mojo_marimo import run_mojo
-
-    mo.md("✅ **Executor imported**")
-    return np, run_mojo
-
-
 @app.cell
 def _(mo):
     # UI controls
-    width_slider = mo.ui.slider(50, 800, value=400, step=50, label="Width", show_value=True)
-    height_slider = mo.ui.slider(50, 600, value=300, step=50, label="Height", show_value=True)
+    width_slider = mo.ui.slider(
+        50, 800, value=400, step=50, label="Width", show_value=True, debounce=True
+    )
+    height_slider = mo.ui.slider(
+        50, 600, value=300, step=50, label="Height", show_value=True, debounce=True
+    )
     max_iter_slider = mo.ui.slider(
-        50, 500, value=256, step=50, label="Max Iterations", show_value=True
+        50, 500, value=256, step=50, label="Max Iterations", show_value=True, debounce=True
     )
 
     mo.hstack([width_slider, height_slider, max_iter_slider])
@@ -50,9 +48,13 @@ def _(mo):
 
 
 @app.cell
-def _(height_slider, max_iter_slider, width_slider):
-    # Build dynamic Mojo code
-    mojo_code = f"""
+def _():
+    # Mojo code for the whole grid. The size and iteration limit are
+    # arguments, so one compiled binary serves every slider setting.
+    mojo_code = """
+    from algorithm import parallelize
+    from sys import argv, num_physical_cores
+
     fn mandelbrot_point(cx: Float64, cy: Float64, max_iter: Int) -> Int:
         var x: Float64 = 0.0
         var y: Float64 = 0.0
@@ -66,10 +68,11 @@ def _(height_slider, max_iter_slider, width_slider):
             iteration += 1
         return iteration
 
-    fn main():
-        var width = {width_slider.value}
-        var height = {height_slider.value}
-        var max_iter = {max_iter_slider.value}
+    fn main() raises:
+        var args = argv()
+        var width = atol(args[1])
+        var height = atol(args[2])
+        var max_iter = atol(args[3])
         var x_min = -2.5
         var x_max = 1.0
         var y_min = -1.25
@@ -77,15 +80,23 @@ def _(height_slider, max_iter_slider, width_slider):
         var dx = (x_max - x_min) / Float64(width)
         var dy = (y_max - y_min) / Float64(height)
 
-        for row in range(height):
+        # Rows are independent, so they are computed in parallel
+        var counts = List[Int32](length=width * height, fill=0)
+        var pixels = counts.unsafe_ptr()
+
+        @parameter
+        fn compute_row(row: Int):
             var cy = y_min + Float64(row) * dy
             for col in range(width):
                 var cx = x_min + Float64(col) * dx
-                var iterations = mandelbrot_point(cx, cy, max_iter)
-                print(iterations, end="")
-                if col < width - 1:
-                    print(",", end="")
-            print()
+                pixels[row * width + col] = Int32(mandelbrot_point(cx, cy, max_iter))
+
+        parallelize[compute_row](height, min(height, num_physical_cores()))
+
+        # Raw Int32 counts, row-major: no digits to print here or to parse
+        # in Python
+        with open("/dev/stdout", "w") as out:
+            out.write_bytes(Span(counts).as_bytes())
     """
     return (mojo_code,)
 
@@ -99,26 +110,25 @@ def _(mo, mojo_code):
 
 
 @app.cell
-def _(mojo_code, run_mojo):
-    # Execute Mojo code
-    result = run_mojo(mojo_code)
+def _(height_slider, max_iter_slider, mojo_code, run_mojo, width_slider):
+    # Execute Mojo code, keeping stdout as bytes
+    result = run_mojo(
+        mojo_code,
+        extra_args=[str(width_slider.value), str(height_slider.value), str(max_iter_slider.value)],
+        raw_output=True,
+    )
     return (result,)
 
 
 @app.cell
 def _(height_slider, mo, np, result, width_slider):
-    # Parse CSV output into 2D array
+    # View the raw Int32 counts as a 2D array, without copying
     if result is None:
         mo.md("❌ **Compilation or execution failed**")
 
-    lines = result.split("\n")
-    data = []
-    for line in lines:
-        if line.strip() and "," in line:
-            row = [int(x) for x in line.split(",")]
-            data.append(row)
-
-    mandelbrot_array = np.array(data)
+    mandelbrot_array = np.frombuffer(result, dtype=np.int32).reshape(
+        height_slider.value, width_slider.value
+    )
 
     mo.md(
         f"✅ **Computed {width_slider.value}×{height_slider.value} grid** ({mandelbrot_array.size:,} points)"
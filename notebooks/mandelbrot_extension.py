@@ -34,9 +34,31 @@ def _(mo):
     import mandelbrot_ext  # Auto-compiles examples/mandelbrot_ext.mojo
     import mojo.importer  # Register import hook
     import numpy as np
+    import plotly.graph_objects as go
 
     mo.md("✅ **Extension module imported** - First import compiles `.mojo` → `.so` (~1-2s)")
-    return mandelbrot_ext, mojo, np
+    return go, mandelbrot_ext, mojo, np
+
+
+@app.cell
+def _(go, np):
+    def display_heatmap(counts, max_rows=300, max_cols=400, **kwargs):
+        """Heatmap of every n-th pixel, at most max_rows × max_cols cells.
+
+        The browser receives the whole z array on every update, so a full
+        800×600 grid dominates slider latency. Counts are sent as uint16
+        (max_iter is at most 512) and the axes keep full-grid pixel indices.
+        """
+        rows, cols = counts.shape
+        stride = max(1, -(-rows // max_rows), -(-cols // max_cols))
+        return go.Heatmap(
+            z=counts[::stride, ::stride].astype(np.uint16),
+            x=np.arange(0, cols, stride),
+            y=np.arange(0, rows, stride),
+            **kwargs,
+        )
+
+    return (display_heatmap,)
 
 
 @app.cell
@@ -55,7 +77,7 @@ def _(mo):
 @app.cell
 def _(height_slider, mandelbrot_ext, max_iter_slider, mo, np, width_slider):
     # Direct function call - zero subprocess overhead!
-    result_list = mandelbrot_ext.compute_mandelbrot(
+    mandelbrot_counts = mandelbrot_ext.compute_mandelbrot(
         width_slider.value,
         height_slider.value,
         max_iter_slider.value,
@@ -65,22 +87,31 @@ def _(height_slider, mandelbrot_ext, max_iter_slider, mo, np, width_slider):
         1.25,  # y_min, y_max
     )
 
-    # Convert to numpy array
-    mandelbrot_array = np.array(result_list)
+    # Flat Int32 counts, row-major: a view, no per-pixel conversion
+    mandelbrot_array = np.frombuffer(mandelbrot_counts, dtype=np.int32).reshape(
+        height_slider.value, width_slider.value
+    )
 
     mo.md(
         f"✅ **Computed {width_slider.value}×{height_slider.value} grid** ({mandelbrot_array.size:,} points)"
     )
-    return mandelbrot_array, result_list
+    return mandelbrot_array, mandelbrot_counts
 
 
 @app.cell
-def _(height_slider, mandelbrot_array, max_iter_slider, mo, width_slider):
-    import plotly.graph_objects as go
-
+def _(
+    display_heatmap,
+    go,
+    height_slider,
+    mandelbrot_array,
+    max_iter_slider,
+    mo,
+    width_slider,
+):
+    # Full-resolution counts stay in mandelbrot_array; only the plot is thinned
     fig = go.Figure(
-        data=go.Heatmap(
-            z=mandelbrot_array,
+        data=display_heatmap(
+            mandelbrot_array,
             colorscale="Hot",
             colorbar=dict(title="Iterations"),
             hovertemplate="x: %{x}<br>y: %{y}<br>iterations: %{z}<extra></extra>",
@@ -98,7 +129,7 @@ def _(height_slider, mandelbrot_array, max_iter_slider, mo, width_slider):
 
     mandelbrot_plot = mo.ui.plotly(fig)
     mandelbrot_plot
-    return fig, go, mandelbrot_plot
+    return fig, mandelbrot_plot
 
 
 @app.cell
@@ -131,18 +162,16 @@ def _(mo):
 
 
 @app.cell
-def _(mandelbrot_ext, mo, np, region):
-    import plotly.graph_objects as go
-
+def _(display_heatmap, go, mandelbrot_ext, mo, np, region):
     # Get region bounds
     x_min, x_max, y_min, y_max = region.value
 
     # Compute zoomed region
-    zoom_data = mandelbrot_ext.compute_mandelbrot(500, 400, 512, x_min, x_max, y_min, y_max)
-    zoom_array = np.array(zoom_data)
+    zoom_counts = mandelbrot_ext.compute_mandelbrot(500, 400, 512, x_min, x_max, y_min, y_max)
+    zoom_array = np.frombuffer(zoom_counts, dtype=np.int32).reshape(400, 500)
 
     fig_zoom = go.Figure(
-        data=go.Heatmap(z=zoom_array, colorscale="Hot", colorbar=dict(title="Iterations"))
+        data=display_heatmap(zoom_array, colorscale="Hot", colorbar=dict(title="Iterations"))
     )
 
     fig_zoom.update_layout(
@@ -155,7 +184,7 @@ def _(mandelbrot_ext, mo, np, region):
     )
 
     mo.ui.plotly(fig_zoom)
-    return fig_zoom, go, x_max, x_min, y_max, y_min, zoom_array, zoom_data
+    return fig_zoom, x_max, x_min, y_max, y_min, zoom_array, zoom_counts
 
 
 @app.cell
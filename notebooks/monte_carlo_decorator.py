@@ -6,9 +6,11 @@ app = marimo.App(width="medium")
 
 @app.cell
 def _():
+    import math
+
     import marimo as mo
 
-    return (mo,)
+    return math, mo
 
 
 @app.cell
@@ -32,13 +34,14 @@ def _(mo):
 
 @app.cell
 def _(mo):
-    from mojo_marimo import mojo
+    from py_run_mojo import mojo
 
-    @mojo
+    # Random sampling: every call must really run, never reuse a result
+    @mojo(pure=False)
     def estimate_pi_mojo(samples: int) -> float:
         """
+        from sys import argv
         from random import random_float64
-        from math import sqrt
 
         fn estimate_pi(samples: Int) -> Float64:
             var inside_circle: Int = 0
@@ -46,20 +49,43 @@ def _(mo):
             for _ in range(samples):
                 var x = random_float64()
                 var y = random_float64()
-                var distance = sqrt(x * x + y * y)
-
-                if distance <= 1.0:
+                if x * x + y * y <= 1.0:
                     inside_circle += 1
 
             return 4.0 * Float64(inside_circle) / Float64(samples)
 
-        fn main():
-            print(estimate_pi({{samples}}))
+        fn main() raises:
+            print(estimate_pi(atol(argv()[1])))
+        """
+        ...
+
+    # One pass over the largest sample size, printing the running estimate at
+    # each (ascending) checkpoint, so a sweep is a single run
+    @mojo(pure=False)
+    def estimate_pi_checkpoints(checkpoints: list[int]) -> list[float]:
+        """
+        from sys import argv
+        from random import random_float64
+
+        fn main() raises:
+            var args = argv()
+            var inside_circle: Int = 0
+            var total: Int = 0
+
+            for i in range(1, len(args)):
+                var checkpoint = atol(args[i])
+                while total < checkpoint:
+                    var x = random_float64()
+                    var y = random_float64()
+                    if x * x + y * y <= 1.0:
+                        inside_circle += 1
+                    total += 1
+                print(4.0 * Float64(inside_circle) / Float64(total))
         """
         ...
 
-    mo.md("✅ **Mojo function defined with decorator**")
-    return (estimate_pi_mojo,)
+    mo.md("✅ **Mojo functions defined with decorator**")
+    return estimate_pi_checkpoints, estimate_pi_mojo
 
 
 @app.cell
@@ -71,15 +97,14 @@ def _(mo):
         value=100_000,
         label="Number of samples",
         show_value=True,
+        debounce=True,
     )
     samples_slider
     return (samples_slider,)
 
 
 @app.cell
-def _(estimate_pi_mojo, mo, samples_slider):
-    import math
-
+def _(estimate_pi_mojo, math, mo, samples_slider):
     # Run Mojo estimation
     pi_estimate = estimate_pi_mojo(samples_slider.value)
     pi_actual = math.pi
@@ -96,7 +121,7 @@ def _(estimate_pi_mojo, mo, samples_slider):
         **Error**: {error:.10f} ({error_percent:.4f}%)
         """
     )
-    return error, error_percent, math, pi_actual, pi_estimate
+    return error, error_percent, pi_actual, pi_estimate
 
 
 @app.cell
@@ -112,98 +137,111 @@ def _(mo):
 
 
 @app.cell
-def _(estimate_pi_mojo, mo):
-    import math
-
+def _(mo):
     import numpy as np
-    import plotly.graph_objects as go
 
-    # Generate estimates for different sample sizes
-    sample_sizes = [10**i for i in range(2, 7)]  # 100 to 1,000,000
-    estimates = []
-    errors = []
+    # One generator shared by every sweep in the session
+    _rng = np.random.default_rng()
 
-    for n in sample_sizes:
-        est = estimate_pi_mojo(n)
-        estimates.append(est)
-        errors.append(abs(est - math.pi))
+    def estimate_pi_numpy_checkpoints(checkpoints, chunk=1_000_000, seed=None):
+        """NumPy version of the sweep: running estimates at ascending checkpoints.
+
+        Samples are drawn in chunks (16 MB at most), so large sizes don't
+        allocate every point at once. Pass ``seed`` for a reproducible sweep.
+        """
+        rng = _rng if seed is None else np.random.default_rng(seed)
+        inside = total = 0
+        estimates = []
+        for checkpoint in checkpoints:
+            while total < checkpoint:
+                n = min(chunk, checkpoint - total)
+                xy = rng.random((n, 2))
+                inside += int(np.count_nonzero((xy * xy).sum(axis=1) <= 1.0))
+                total += n
+            estimates.append(4.0 * inside / total)
+        return estimates
+
+    sweep_engine = mo.ui.radio(
+        options=["Mojo", "NumPy"], value="Mojo", label="Compute the sweep with"
+    )
+    sweep_engine
+    return estimate_pi_numpy_checkpoints, np, sweep_engine
 
-    # Create convergence plot
-    fig = go.Figure()
 
+@app.cell
+def _(estimate_pi_checkpoints, estimate_pi_numpy_checkpoints, math, mo, sweep_engine):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # Generate estimates for different sample sizes in one run. Cached per
+    # engine, so toggling back and forth doesn't draw a fresh sweep each time.
+    @mo.cache
+    def convergence_sweep(engine: str, sizes: tuple[int, ...]) -> list[float]:
+        if engine == "NumPy":
+            return estimate_pi_numpy_checkpoints(sizes)
+        return estimate_pi_checkpoints(list(sizes))
+
+    sample_sizes = [10**i for i in range(2, 7)]  # 100 to 1,000,000
+    estimates = convergence_sweep(sweep_engine.value, tuple(sample_sizes))
+    errors = [abs(est - math.pi) for est in estimates]
+
+    # Convergence and error side by side in one figure
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=["Monte Carlo Convergence to π", "Estimation Error vs Sample Size"],
+    )
     fig.add_trace(
         go.Scatter(
             x=sample_sizes,
             y=estimates,
             mode="lines+markers",
-            name="Mojo Estimate",
+            name=f"{sweep_engine.value} Estimate",
             line=dict(color="#ff6b35", width=3),
             marker=dict(size=10),
-        )
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=sample_sizes,
+            y=errors,
+            mode="lines+markers",
+            name="Absolute Error",
+            line=dict(color="#d62828", width=3),
+            marker=dict(size=10),
+        ),
+        row=1,
+        col=2,
     )
-
     fig.add_hline(
         y=math.pi,
         line_dash="dash",
         line_color="green",
         annotation_text="Actual π",
-        annotation_position="right",
-    )
-
-    fig.update_layout(
-        title="Monte Carlo Convergence to π",
-        xaxis_title="Number of Samples",
-        yaxis_title="Estimated π",
-        xaxis_type="log",
-        height=400,
-        hovermode="x unified",
+        row=1,
+        col=1,
     )
+    fig.update_xaxes(title_text="Number of Samples", type="log")
+    fig.update_yaxes(title_text="Estimated π", row=1, col=1)
+    fig.update_yaxes(title_text="Absolute Error", type="log", row=1, col=2)
+    fig.update_layout(height=400, hovermode="x unified")
 
     convergence_plot = mo.ui.plotly(fig)
     convergence_plot
     return (
         convergence_plot,
+        convergence_sweep,
         errors,
         estimates,
         fig,
         go,
-        n,
-        np,
+        make_subplots,
         sample_sizes,
     )
 
 
-@app.cell
-def _(errors, go, mo, sample_sizes):
-    # Error plot
-    fig_error = go.Figure()
-
-    fig_error.add_trace(
-        go.Scatter(
-            x=sample_sizes,
-            y=errors,
-            mode="lines+markers",
-            name="Absolute Error",
-            line=dict(color="#d62828", width=3),
-            marker=dict(size=10),
-        )
-    )
-
-    fig_error.update_layout(
-        title="Estimation Error vs Sample Size",
-        xaxis_title="Number of Samples",
-        yaxis_title="Absolute Error",
-        xaxis_type="log",
-        yaxis_type="log",
-        height=400,
-        hovermode="x unified",
-    )
-
-    error_plot = mo.ui.plotly(fig_error)
-    error_plot
-    return error_plot, fig_error
-
-
 @app.cell
 def _(mo):
     mo.md(
@@ -6,9 +6,14 @@ app = marimo.App(width="medium")
 
 @app.cell
 def _():
+    import math
+    from pathlib import Path
+
     import marimo as mo
 
-    return (mo,)
+    from py_run_mojo import run_mojo
+
+    return Path, math, mo, run_mojo
 
 
 @app.cell
@@ -31,16 +36,12 @@ def _(mo):
 
 
 @app.cell
-def _(mo):
-    from pathlib import Path
-
-    from mojo_marimo import run_mojo
-
+def _(Path, mo):
     # Path to standalone Mojo file
     mojo_file = Path("examples/monte_carlo.mojo")
 
     mo.md(f"✅ **Using Mojo file**: `{mojo_file}`")
-    return Path, mojo_file, run_mojo
+    return (mojo_file,)
 
 
 @app.cell
@@ -52,46 +53,17 @@ def _(mo):
         value=100_000,
         label="Number of samples",
         show_value=True,
+        debounce=True,
     )
     samples_slider
     return (samples_slider,)
 
 
 @app.cell
-def _(mo, samples_slider):
-    # Build dynamic Mojo code
-    mojo_code = f"""
-from random import random_float64
-from math import sqrt
-
-fn estimate_pi(samples: Int) -> Float64:
-    var inside_circle: Int = 0
-    
-    for _ in range(samples):
-        var x = random_float64()
-        var y = random_float64()
-        var distance = sqrt(x * x + y * y)
-        
-        if distance <= 1.0:
-            inside_circle += 1
-    
-    return 4.0 * Float64(inside_circle) / Float64(samples)
-
-fn main():
-    var pi_estimate = estimate_pi({samples_slider.value})
-    print(pi_estimate)
-"""
-
-    mo.md("✅ **Dynamic Mojo code generated**")
-    return (mojo_code,)
-
-
-@app.cell
-def _(mojo_code, mo, run_mojo, samples_slider):
-    import math
-
-    # Execute Mojo code
-    result = run_mojo(mojo_code)
+def _(math, mo, mojo_file, run_mojo, samples_slider):
+    # Execute the Mojo file: the sample count is an argument, so every slider
+    # value reuses the one cached binary
+    result = run_mojo(str(mojo_file), extra_args=[str(samples_slider.value)])
 
     if result is None:
         mo.md("❌ **Compilation or execution failed**")
@@ -111,7 +83,7 @@ def _(mojo_code, mo, run_mojo, samples_slider):
             **Error**: {error:.10f} ({error_percent:.4f}%)
             """
         )
-    return error, error_percent, math, pi_actual, pi_estimate, result
+    return error, error_percent, pi_actual, pi_estimate, result
 
 
 @app.cell
@@ -127,69 +99,95 @@ def _(mo):
 
 
 @app.cell
-def _(mo, run_mojo):
-    import math
+def _(mo):
+    import numpy as np
 
+    # One generator shared by every sweep in the session
+    _rng = np.random.default_rng()
+
+    def estimate_pi_numpy_checkpoints(checkpoints, chunk=1_000_000, seed=None):
+        """NumPy version of the sweep: running estimates at ascending checkpoints.
+
+        Samples are drawn in chunks (16 MB at most), so large sizes don't
+        allocate every point at once. Pass ``seed`` for a reproducible sweep.
+        """
+        rng = _rng if seed is None else np.random.default_rng(seed)
+        inside = total = 0
+        estimates = []
+        for checkpoint in checkpoints:
+            while total < checkpoint:
+                n = min(chunk, checkpoint - total)
+                xy = rng.random((n, 2))
+                inside += int(np.count_nonzero((xy * xy).sum(axis=1) <= 1.0))
+                total += n
+            estimates.append(4.0 * inside / total)
+        return estimates
+
+    sweep_engine = mo.ui.radio(
+        options=["Mojo", "NumPy"], value="Mojo", label="Compute the sweep with"
+    )
+    sweep_engine
+    return estimate_pi_numpy_checkpoints, np, sweep_engine
+
+
+@app.cell
+def _(estimate_pi_numpy_checkpoints, math, mo, run_mojo, sweep_engine):
     import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
-    # Generate estimates for different sample sizes
+    # Generate estimates for different sample sizes in one pass: the program
+    # draws up to the largest size and prints the running estimate at each
+    # (ascending) checkpoint passed as an argument
     sample_sizes = [10**i for i in range(2, 7)]
-    estimates = []
-    errors = []
-
-    for n in sample_sizes:
-        code = f"""
+    code = """
+from sys import argv
 from random import random_float64
-from math import sqrt
 
-fn estimate_pi(samples: Int) -> Float64:
+fn main() raises:
+    var args = argv()
     var inside_circle: Int = 0
-    for _ in range(samples):
-        var x = random_float64()
-        var y = random_float64()
-        if sqrt(x * x + y * y) <= 1.0:
-            inside_circle += 1
-    return 4.0 * Float64(inside_circle) / Float64(samples)
-
-fn main():
-    print(estimate_pi({n}))
+    var total: Int = 0
+    for i in range(1, len(args)):
+        var checkpoint = atol(args[i])
+        while total < checkpoint:
+            var x = random_float64()
+            var y = random_float64()
+            if x * x + y * y <= 1.0:
+                inside_circle += 1
+            total += 1
+        print(4.0 * Float64(inside_circle) / Float64(total))
 """
-        result = run_mojo(code)
-        if result:
-            est = float(result.strip())
-            estimates.append(est)
-            errors.append(abs(est - math.pi))
-
-    # Convergence plot
-    fig = go.Figure()
+
+    # Cached per engine, so toggling back and forth doesn't redo the sweep
+    @mo.cache
+    def convergence_sweep(engine: str, sizes: tuple[int, ...]) -> list[float]:
+        if engine == "NumPy":
+            return estimate_pi_numpy_checkpoints(sizes)
+        result = run_mojo(code, extra_args=[str(n) for n in sizes])
+        return [float(line) for line in result.splitlines()] if result else []
+
+    estimates = convergence_sweep(sweep_engine.value, tuple(sample_sizes))
+    errors = [abs(est - math.pi) for est in estimates]
+
+    # Convergence and error side by side in one figure
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=["Monte Carlo Convergence to π", "Estimation Error vs Sample Size"],
+    )
     fig.add_trace(
         go.Scatter(
             x=sample_sizes,
             y=estimates,
             mode="lines+markers",
-            name="Mojo Estimate",
+            name=f"{sweep_engine.value} Estimate",
             line=dict(color="#ff6b35", width=3),
             marker=dict(size=10),
-        )
+        ),
+        row=1,
+        col=1,
     )
-    fig.add_hline(y=math.pi, line_dash="dash", line_color="green", annotation_text="Actual π")
-    fig.update_layout(
-        title="Monte Carlo Convergence to π",
-        xaxis_title="Number of Samples",
-        yaxis_title="Estimated π",
-        xaxis_type="log",
-        height=400,
-    )
-
-    mo.ui.plotly(fig)
-    return code, errors, est, estimates, fig, go, n, sample_sizes
-
-
-@app.cell
-def _(errors, go, mo, sample_sizes):
-    # Error plot
-    fig_error = go.Figure()
-    fig_error.add_trace(
+    fig.add_trace(
         go.Scatter(
             x=sample_sizes,
             y=errors,
@@ -197,18 +195,25 @@ def _(errors, go, mo, sample_sizes):
             name="Absolute Error",
             line=dict(color="#d62828", width=3),
             marker=dict(size=10),
-        )
+        ),
+        row=1,
+        col=2,
     )
-    fig_error.update_layout(
-        title="Estimation Error vs Sample Size",
-        xaxis_title="Number of Samples",
-        yaxis_title="Absolute Error",
-        xaxis_type="log",
-        yaxis_type="log",
-        height=400,
+    fig.add_hline(
+        y=math.pi,
+        line_dash="dash",
+        line_color="green",
+        annotation_text="Actual π",
+        row=1,
+        col=1,
     )
-    mo.ui.plotly(fig_error)
-    return (fig_error,)
+    fig.update_xaxes(title_text="Number of Samples", type="log")
+    fig.update_yaxes(title_text="Estimated π", row=1, col=1)
+    fig.update_yaxes(title_text="Absolute Error", type="log", row=1, col=2)
+    fig.update_layout(height=400, hovermode="x unified")
+
+    mo.ui.plotly(fig)
+    return code, convergence_sweep, errors, estimates, fig, go, make_subplots, sample_sizes
 
 
 @app.cell
@@ -6,9 +6,11 @@ app = marimo.App(width="medium")
 
 @app.cell
 def _():
+    import math
+
     import marimo as mo
 
-    return (mo,)
+    return math, mo
 
 
 @app.cell
@@ -54,9 +56,7 @@ def _(mo):
 
 
 @app.cell
-def _(mo, monte_carlo_ext, samples_slider):
-    import math
-
+def _(math, mo, monte_carlo_ext, samples_slider):
     # Direct function call - zero subprocess overhead!
     pi_estimate = monte_carlo_ext.estimate_pi(samples_slider.value)
     pi_actual = math.pi
@@ -75,7 +75,7 @@ def _(mo, monte_carlo_ext, samples_slider):
         **Call overhead**: ~0.01-0.1ms (direct function call, no subprocess)
         """
     )
-    return error, error_percent, math, pi_actual, pi_estimate
+    return error, error_percent, pi_actual, pi_estimate
 
 
 @app.cell
@@ -92,6 +92,7 @@ def _(mo):
 
 @app.cell
 def _(mo, monte_carlo_ext):
+    import numpy as np
     import plotly.graph_objects as go
 
     # Generate samples with coordinates
@@ -99,16 +100,15 @@ def _(mo, monte_carlo_ext):
     result_dict = monte_carlo_ext.generate_samples(viz_samples)
 
     # Extract data
-    x_coords = result_dict["x"]
-    y_coords = result_dict["y"]
-    inside_flags = result_dict["inside"]
+    x_coords = np.asarray(result_dict["x"])
+    y_coords = np.asarray(result_dict["y"])
+    inside_flags = np.asarray(result_dict["inside"], dtype=bool)
     pi_est = result_dict["pi_estimate"]
 
-    # Separate inside/outside points
-    x_inside = [x for x, inside in zip(x_coords, inside_flags) if inside]
-    y_inside = [y for y, inside in zip(y_coords, inside_flags) if inside]
-    x_outside = [x for x, inside in zip(x_coords, inside_flags) if not inside]
-    y_outside = [y for y, inside in zip(y_coords, inside_flags) if not inside]
+    # Separate inside/outside points with one mask and its negation
+    outside_flags = ~inside_flags
+    x_inside, y_inside = x_coords[inside_flags], y_coords[inside_flags]
+    x_outside, y_outside = x_coords[outside_flags], y_coords[outside_flags]
 
     # Create scatter plot
     fig = go.Figure()
@@ -134,8 +134,6 @@ def _(mo, monte_carlo_ext):
     )
 
     # Add unit circle
-    import numpy as np
-
     theta = np.linspace(0, 2 * np.pi, 100)
     fig.add_trace(
         go.Scatter(
@@ -165,6 +163,7 @@ def _(mo, monte_carlo_ext):
         go,
         inside_flags,
         np,
+        outside_flags,
         pi_est,
         result_dict,
         scatter_plot,
@@ -192,18 +191,11 @@ def _(mo):
 
 
 @app.cell
-def _(go, mo, monte_carlo_ext):
-    import math
-
-    # Test different sample sizes
+def _(go, math, mo, monte_carlo_ext):
+    # Test different sample sizes, in one pass over the largest
     sample_sizes = [10**i for i in range(2, 7)]
-    estimates = []
-    errors = []
-
-    for n in sample_sizes:
-        est = monte_carlo_ext.estimate_pi(n)
-        estimates.append(est)
-        errors.append(abs(est - math.pi))
+    estimates = monte_carlo_ext.estimate_pi_checkpoints(sample_sizes)
+    errors = [abs(est - math.pi) for est in estimates]
 
     # Convergence plot
     fig_conv = go.Figure()
@@ -227,7 +219,7 @@ def _(go, mo, monte_carlo_ext):
     )
 
     mo.ui.plotly(fig_conv)
-    return errors, est, estimates, fig_conv, n, sample_sizes
+    return errors, estimates, fig_conv, sample_sizes
 
 
 @app.cell
@@ -29,25 +29,29 @@ def _(mo):
     @mojo
     def my_func(n: int) -> int:
         '''
+        from sys import argv
+
         fn my_func(n: Int) -> Int:
             return n * n
 
-        fn main():
-            print(my_func({{n}}))
+        fn main() raises:
+            print(my_func(atol(argv()[1])))
         '''
         ...
 
     result = my_func(10)  # Returns: 100
     ```
 
-    Use `{{parameter}}` for substitution.
+    Arguments reach `main()` as command-line arguments, so one compiled
+    binary serves every input. A `{{parameter}}` placeholder substitutes the
+    value into the source instead, but compiles once per distinct value.
     """)
     return
 
 
 @app.cell
 def _():
-    from mojo_marimo import get_mojo_version, mojo
+    from py_run_mojo import get_mojo_version, mojo
 
     return get_mojo_version, mojo
 
@@ -74,6 +78,8 @@ def _(mojo):
     @mojo
     def fibonacci(n: int) -> int:
         """
+        from sys import argv
+
         fn fibonacci(n: Int) -> Int:
             if n <= 1:
                 return n
@@ -85,8 +91,8 @@ def _(mojo):
                 curr = next_val
             return curr
 
-        fn main():
-            print(fibonacci({{n}}))
+        fn main() raises:
+            print(fibonacci(atol(argv()[1])))
         """
         ...
 
@@ -122,14 +128,16 @@ def _(mojo):
     @mojo
     def sum_squares(n: int) -> int:
         """
+        from sys import argv
+
         fn sum_squares(n: Int) -> Int:
             var total: Int = 0
             for i in range(1, n + 1):
                 total += i * i
             return total
 
-        fn main():
-            print(sum_squares({{n}}))
+        fn main() raises:
+            print(sum_squares(atol(argv()[1])))
         """
         ...
 
@@ -163,6 +171,8 @@ def _(mojo):
     @mojo
     def is_prime(n: int) -> bool:
         """
+        from sys import argv
+
         fn is_prime(n: Int) -> Bool:
             if n < 2:
                 return False
@@ -179,8 +189,8 @@ def _(mojo):
 
             return True
 
-        fn main():
-            print(is_prime({{n}}))
+        fn main() raises:
+            print(is_prime(atol(argv()[1])))
         """
         ...
 
@@ -221,6 +231,8 @@ def _(mojo):
     @mojo
     def gcd(a: int, b: int) -> int:
         """
+        from sys import argv
+
         fn gcd(a: Int, b: Int) -> Int:
             var x = a
             var y = b
@@ -230,8 +242,8 @@ def _(mojo):
                 x = temp
             return x
 
-        fn main():
-            print(gcd({{a}}, {{b}}))
+        fn main() raises:
+            print(gcd(atol(argv()[1]), atol(argv()[2])))
         """
         ...
 
@@ -253,6 +265,64 @@ def _(gcd, mo):
     return
 
 
+@app.cell(hide_code=True)
+def _(mo):
+    mo.md(r"""
+    ---
+    ## Example 5: Persistent Worker
+
+    Even with a cached binary, each call starts a new process. With
+    `worker=True` the binary is started once and kept running: each call
+    writes its arguments as one stdin line and reads one result line back,
+    so repeated calls cost a pipe round trip instead of a process start.
+    `main()` loops over `input()` until stdin closes.
+    """)
+    return
+
+
+@app.cell
+def _(mojo):
+    @mojo(worker=True)
+    def fibonacci_worker(n: int) -> int:
+        """
+        fn fibonacci(n: Int) -> Int:
+            if n <= 1:
+                return n
+            var prev: Int = 0
+            var curr: Int = 1
+            for _ in range(2, n + 1):
+                var next_val = prev + curr
+                prev = curr
+                curr = next_val
+            return curr
+
+        fn main():
+            # Answer one request per stdin line until the notebook closes it
+            while True:
+                try:
+                    print(fibonacci(atol(input())), flush=True)
+                except:
+                    break
+        """
+        ...
+
+    return (fibonacci_worker,)
+
+
+@app.cell
+def _(fibonacci_worker, mo):
+    # One process answers every call; batch() pipelines all the requests
+    worker_values = fibonacci_worker.batch(range(1, 31))
+
+    mo.md(f"""
+    ```python
+    fibonacci_worker(30) = {fibonacci_worker(30):,}
+    fibonacci_worker.batch(range(1, 31))[-5:] = {worker_values[-5:]}
+    ```
+    """)
+    return
+
+
 @app.cell(hide_code=True)
 def _(mo):
     mo.md(r"""
@@ -288,6 +358,7 @@ def _(mo):
     - ✅ Mojo code visible in notebook
     - ✅ Automatic type conversion
     - ✅ Cached execution (~10-50ms after first compile)
+    - ✅ Persistent workers (`worker=True`) for many small calls
     - ✅ Pre-compilation validation with helpful hints
 
     **When to use:**
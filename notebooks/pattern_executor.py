@@ -11,9 +11,18 @@ app = marimo.App(width="medium")
 
 @app.cell
 def _():
+    from pathlib import Path
+
     import marimo as mo
 
-    return (mo,)
+    from py_run_mojo import get_mojo_version, prewarm, run_mojo
+    from py_run_mojo.decorator import PREWARM
+
+    # With PY_RUN_MOJO_PREWARM=1, compile the Pattern 4 file in the background
+    # while the cells above it run
+    if PREWARM:
+        prewarm([str(Path(__file__).parent.parent / "examples" / "examples.mojo")])
+    return Path, get_mojo_version, mo, run_mojo
 
 
 @app.cell(hide_code=True)
@@ -42,15 +51,6 @@ def _(mo):
     return
 
 
-@app.cell
-def _():
-    from pathlib import Path
-
-    from py_run_mojo import get_mojo_version, run_mojo
-
-    return Path, get_mojo_version, run_mojo
-
-
 @app.cell
 def _(get_mojo_version, mo):
     mo.md(f"""
@@ -343,14 +343,19 @@ def _(mo, run_mojo):
         """Generate and execute Mojo code for different operations."""
         operations = {"add": "a + b", "multiply": "a * b", "power": "a ** b"}
 
+        # Operands are passed on the command line, so the generated source
+        # (and its cached binary) depends only on the operation
         mojo_code = f"""
+        from sys import argv
+
         fn compute(a: Int, b: Int) -> Int:
             return {operations[operation]}
 
-        fn main():
-            print(compute({a}, {b}))
+        fn main() raises:
+            var args = argv()
+            print(compute(atol(args[1]), atol(args[2])))
         """
-        return run_mojo(mojo_code), mojo_code
+        return run_mojo(mojo_code, extra_args=[str(a), str(b)]), mojo_code
 
     # Try different operations
     add_result, add_code = compute_with_mojo(5, 3, "add")
@@ -399,13 +404,14 @@ def _(Path, mo):
     {mojo_content}
     ```
     """)
-    return (mojo_file,)
+    return mojo_content, mojo_file
 
 
 @app.cell
-def _(mo, mojo_file, run_mojo):
-    # Execute the .mojo file
-    file_result = run_mojo(str(mojo_file))
+def _(mo, mojo_content, mojo_file, run_mojo):
+    # Execute the .mojo file. run_mojo(str(mojo_file)) works too, but passing
+    # the text already read above avoids reading the file a second time.
+    file_result = run_mojo(mojo_content)
 
     mo.md(f"""
     **Executing** `{mojo_file.name}`:
@@ -7,15 +7,12 @@ This script:
 4. Compares results for consistency
 
 Run this before using the marimo notebooks to ensure your environment is set up correctly.
+Requires the project to be installed (`uv pip install -e .`), which makes both
+`py_run_mojo` and the top-level `examples` package importable.
 """
 
 import subprocess
 import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
 
 
 def check_mojo_available():
@@ -76,10 +73,6 @@ def main():
     print("=" * 60)
 
     # Import after checking mojo is available
-    # Add examples to path
-    examples_path = Path(__file__).parent.parent / "examples"
-    sys.path.insert(0, str(examples_path))
-
     from examples import fibonacci as fib_example
     from py_run_mojo.decorator import fibonacci as fib_decorator
     from py_run_mojo.executor import clear_cache
@@ -7,12 +7,18 @@ from any Python environment (notebooks, scripts, REPLs):
 2. Cached Binary - Fast repeated execution with SHA256-based caching
 3. Decorator - Clean Pythonic syntax with cached performance
 
+For many calls in a tight loop, ``MojoWorker`` keeps one compiled Mojo process
+alive and talks to it over pipes, avoiding per-call process start-up, and
+``@mojo(native=True)`` calls ``@export`` functions in a shared library directly.
+
 Example:
     from py_run_mojo import mojo
 
     @mojo
     def fibonacci(n: int) -> int:
         '''
+        from sys import argv
+
         fn fibonacci(n: Int) -> Int:
             if n <= 1:
                 return n
@@ -24,8 +30,8 @@ Example:
                 curr = next_val
             return curr
 
-        fn main():
-            print(fibonacci({n}))
+        fn main() raises:
+            print(fibonacci(atol(argv()[1])))
         '''
         pass
 
@@ -37,16 +43,34 @@ __author__ = "Michael Booth"
 __email__ = "michael@databooth.com.au"
 
 # Core functionality
-from py_run_mojo.decorator import mojo
-from py_run_mojo.executor import cache_stats, clear_cache, get_mojo_version, run_mojo
+from py_run_mojo.decorator import mojo, prewarm
+from py_run_mojo.executor import (
+    benchmark_mojo,
+    cache_stats,
+    clear_cache,
+    compile_mojo,
+    get_mojo_version,
+    load_mojo_library,
+    run_mojo,
+    stream_mojo,
+)
 from py_run_mojo.validator import get_validation_hint, validate_mojo_code
+from py_run_mojo.worker import MojoWorker, close_all_workers, get_worker
 
 __all__ = [
     "run_mojo",
+    "stream_mojo",
+    "compile_mojo",
+    "load_mojo_library",
+    "benchmark_mojo",
     "clear_cache",
     "cache_stats",
     "get_mojo_version",
     "mojo",
+    "prewarm",
     "validate_mojo_code",
     "get_validation_hint",
+    "MojoWorker",
+    "get_worker",
+    "close_all_workers",
 ]
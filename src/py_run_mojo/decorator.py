@@ -1,21 +1,71 @@
 """Decorator for inline Mojo code execution.
 
 This demonstrates the decorator pattern discussed in the Modular forum.
-Currently uses cached binaries (same as mo_run_cached) but structured
-as a decorator for cleaner syntax.
-
-Future enhancement: compile to Python extension modules for zero subprocess overhead.
+By default it uses cached binaries (same as mo_run_cached) but structured
+as a decorator for cleaner syntax. With ``native=True`` the docstring is
+compiled to a shared library and called through ``ctypes`` instead, with no
+subprocess overhead at all, and with ``worker=True`` calls are answered by one
+long-lived process instead of a new one per call.
+
+Set ``PY_RUN_MOJO_PREWARM=1`` to compile each decorated function in a
+background thread as soon as it is defined, so the first call finds its
+binary already cached.
 """
 
+import ctypes
 import inspect
-from collections.abc import Callable
-from functools import wraps
-from typing import Any
-
-from py_run_mojo.executor import get_mojo_version, run_mojo
-
-
-def mojo(func: Callable[..., Any]) -> Callable[..., Any]:
+import os
+import queue
+import re
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from functools import lru_cache, partial, wraps
+from textwrap import dedent
+from typing import Any, get_args, get_origin
+
+from py_run_mojo import executor
+from py_run_mojo.executor import compile_mojo, get_mojo_version, load_mojo_library, run_mojo
+from py_run_mojo.worker import get_worker
+
+# C types for the Python annotations supported by native functions
+_CTYPES: dict[Any, Any] = {int: ctypes.c_int64, float: ctypes.c_double, bool: ctypes.c_bool}
+
+# Mojo code that may give different output for the same inputs. Worker
+# programs must loop on input(), which is their protocol, not a source of
+# nondeterminism, so they are checked without it
+_IMPURE = re.compile(r"\brandom|\btime\b|\bnow\(|\binput\(|\bopen\(")
+_IMPURE_WORKER = re.compile(r"\brandom|\btime\b|\bnow\(|\bopen\(")
+
+PREWARM = os.environ.get("PY_RUN_MOJO_PREWARM", "") not in ("", "0")
+
+# Live decorated functions, keyed by (template, native). Only weakly held, so
+# a function redefined by a re-run notebook cell drops out with its old source
+# instead of being kept alive (and recompiled by ``prewarm()``) forever
+_REGISTERED: weakref.WeakValueDictionary[tuple[str, bool], Callable[..., Any]] = (
+    weakref.WeakValueDictionary()
+)
+
+# Precompile jobs for the background prewarm threads. Each ``mojo build`` is
+# its own process, so independent functions compile in parallel on separate
+# cores; the threads are daemons so pending builds never delay interpreter exit
+PREWARM_THREADS = min(4, os.cpu_count() or 1)
+_prewarm_queue: queue.Queue[Callable[[], object]] = queue.Queue()
+_prewarm_threads: list[threading.Thread] = []
+_prewarm_lock = threading.Lock()
+
+
+def mojo(
+    func: Callable[..., Any] | None = None,
+    *,
+    native: bool = False,
+    cache_size: int | None = 128,
+    pure: bool | None = None,
+    persist: bool = False,
+    worker: bool = False,
+) -> Any:
     """
     Decorator to execute Mojo code from function docstring.
 
@@ -27,6 +77,8 @@ def mojo(func: Callable[..., Any]) -> Callable[..., Any]:
         @mojo
         def fibonacci(n: int) -> int:
             '''
+            from sys import argv
+
             fn fibonacci(n: Int) -> Int:
                 if n <= 1:
                     return n
@@ -38,59 +90,420 @@ def mojo(func: Callable[..., Any]) -> Callable[..., Any]:
                     curr = next_val
                 return curr
 
-            fn main():
-                print(fibonacci({{n}}))
+            fn main() raises:
+                print(fibonacci(atol(argv()[1])))
             '''
             pass
 
         # Use like normal Python function
         result = fibonacci(10)
 
-    Note: Use {{param_name}} in docstring as placeholder for parameter substitution.
+    Note: Parameters are passed to the compiled binary as command-line
+    arguments (lists and tuples are expanded), so one cached binary serves
+    every input and a ``main()`` reading ``sys.argv()`` can process many
+    inputs in one call. A ``{{param_name}}`` placeholder in the docstring
+    substitutes that parameter into the source instead, at the cost of one
+    compile per distinct value.
+    A ``list[...]`` return annotation parses one result per output line, and
+    a ``bytes`` annotation returns stdout undecoded for binary output formats.
+
+    Templates without placeholders compile to a single binary, which
+    ``func.precompile()`` builds ahead of the first call. If its ``main()``
+    prints one result line per argv value, ``func.batch(values)`` computes
+    all of them in a single run and returns the list of converted results.
+
+    Results are memoised per argument tuple (``cache_size`` most recent, or
+    unbounded with ``cache_size=None``), so repeating a call, e.g. when a
+    notebook cell re-runs, skips the run entirely. ``func.cache_clear()``
+    empties the memo. Pass ``cache_size=0`` to disable it; code that uses
+    ``random``, ``time``, ``now()``, ``input()`` (other than a worker's
+    request loop) or ``open()`` is never memoised, and neither are calls with unhashable (e.g. list) arguments
+    or runs that fail.
+    Pass ``pure=True`` or ``pure=False`` to override that detection.
+
+    With ``persist=True`` the outputs of a pure function are also stored on
+    disk next to the binary cache, keyed on the source, Mojo version and
+    arguments, so a new session (or another notebook) gets repeated results
+    without running the binary. ``clear_cache()`` deletes them.
+
+    With ``worker=True`` the binary is started once and kept running as a
+    shared ``MojoWorker``: each call sends its arguments as one stdin line
+    and reads one result line back, so a loop of calls pays process start-up
+    only once. The ``main()`` must answer requests until stdin closes:
+
+        @mojo(worker=True)
+        def square(n: int) -> int:
+            '''
+            fn main():
+                while True:
+                    try:
+                        print(atol(input()) ** 2, flush=True)
+                    except:
+                        break
+            '''
+            ...
+
+    With ``@mojo(native=True)`` the docstring is built as a shared library
+    instead and the ``@export fn`` named like the Python function is called
+    directly through ``ctypes``. Parameters and the return value must be
+    annotated ``int``, ``float`` or ``bool`` (``Int``, ``Float64``, ``Bool``
+    in Mojo), and the code needs no ``main()``:
+
+        @mojo(native=True)
+        def triple(n: int) -> int:
+            '''
+            @export
+            fn triple(n: Int) -> Int:
+                return n * 3
+            '''
+            ...
     """
+    if func is None:
+        return lambda f: mojo(
+            f,
+            native=native,
+            cache_size=cache_size,
+            pure=pure,
+            persist=persist,
+            worker=worker,
+        )
 
     # Extract Mojo code template from docstring
-    mojo_template = func.__doc__
-    if not mojo_template:
+    if not func.__doc__:
         raise ValueError(f"Function {func.__name__} has no docstring with Mojo code")
 
+    # Dedent once so the rendered source, and with it the binary cache key,
+    # depends only on the Mojo code: not on the function's name, module or
+    # how deeply its definition is nested
+    mojo_template = dedent(func.__doc__)
+
     # Get function signature for parameter handling
     sig = inspect.signature(func)
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
+    # Split the template once into literal chunks around the {{param}} names
+    # (odd indices), so a call only joins strings instead of rescanning it
+    chunks = re.split(r"\{\{(\w+)\}\}", mojo_template)
+    placeholders = set(chunks[1::2])
+    raw_output = _parses_bytes(sig.return_annotation)
+
+    # Pure templates: the output is a function of the arguments alone
+    if pure is None:
+        pure = not (_IMPURE_WORKER if worker else _IMPURE).search(mojo_template)
+    persist = persist and pure
+
+    if native:
+        wrapper = _native_wrapper(func, mojo_template, sig, placeholders)
+        return _register(wrapper, (mojo_template, True))
+    if worker and placeholders:
+        raise ValueError(f"Function {func.__name__} uses placeholders and cannot run as a worker")
+
+    def execute(*args, **kwargs) -> str | bytes | None:
         # Bind arguments to parameter names
         bound = sig.bind(*args, **kwargs)
         bound.apply_defaults()
 
-        # Substitute parameters into Mojo template
+        # Substitute parameters into Mojo template, or pass them as argv
         mojo_code = mojo_template
+        if placeholders:
+            rendered = chunks.copy()
+            for i in range(1, len(rendered), 2):
+                name = rendered[i]
+                if name in bound.arguments:
+                    rendered[i] = str(bound.arguments[name])
+                else:
+                    rendered[i] = f"{{{{{name}}}}}"  # Not a parameter: keep as written
+            mojo_code = "".join(rendered)
+
+        argv: list[str] = []
         for param_name, param_value in bound.arguments.items():
-            placeholder = f"{{{{{param_name}}}}}"  # {{param}} in docstring
-            mojo_code = mojo_code.replace(placeholder, str(param_value))
-
-        # Execute via cached binary
-        result = run_mojo(mojo_code, use_cache=True)
-
-        # Convert result based on return type annotation
-        return_type = sig.return_annotation
-        if return_type is int:
-            return int(result) if result else 0
-        if return_type is bool:
-            return result == "True" if result else False
-        if return_type is float:
-            return float(result) if result else 0.0
+            if param_name not in placeholders:
+                argv.extend(_to_argv(param_value))
+
+        # Reuse a stored output, else execute via cached binary
+        key = _result_key(mojo_code, argv) if persist else None
+        result = _load_result(key) if key is not None else None
+        if result is None:
+            if worker:
+                result = get_worker(mojo_template).call(*argv)
+            else:
+                result = run_mojo(
+                    mojo_code, use_cache=True, extra_args=argv or None, raw_output=raw_output
+                )
+            if key is not None and result is not None:
+                _store_result(key, result)
         return result
 
+    # Memoise pure templates' outputs in memory. A failed run raises out of
+    # the memo so it isn't stored, and a later call with the same arguments
+    # tries again
+    def execute_or_raise(*args, **kwargs) -> str | bytes:
+        result = execute(*args, **kwargs)
+        if result is None:
+            raise _RunFailed
+        return result
+
+    memo: Any = None
+    if cache_size != 0 and pure:
+        memo = lru_cache(maxsize=cache_size)(execute_or_raise)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        if memo is not None and _hashable(args, kwargs):
+            try:
+                result = memo(*args, **kwargs)
+            except _RunFailed:
+                result = None
+        else:
+            result = execute(*args, **kwargs)
+
+        # Converted on every call, so list results are never shared between callers
+        return _convert_result(result, sig.return_annotation)
+
+    def cache_clear() -> None:
+        """Forget all memoised results."""
+        if memo is not None:
+            memo.cache_clear()
+
+    def precompile() -> bool:
+        """Compile the template now so the first call hits the binary cache.
+
+        Returns False for templates with placeholders, whose source is only
+        known once arguments are supplied.
+        """
+        if placeholders:
+            return False
+        return compile_mojo(mojo_template) is not None
+
+    def batch(values: Iterable[Any]) -> list[Any]:
+        """Run the binary once for many inputs, one output line per input.
+
+        Each value becomes one command-line argument (tuples expand to several),
+        so the fixed per-run cost is paid once for the whole batch. Worker
+        functions instead send each value as one request, all pipelined
+        to the running worker.
+        """
+        if placeholders:
+            raise ValueError(f"Function {func.__name__} uses placeholders and cannot batch")
+        if worker:
+            responses = get_worker(mojo_template).call_many(_to_argv(v) for v in values)
+            return [_convert_result(r, sig.return_annotation) for r in responses or []]
+
+        argv = _to_argv(list(values))
+        if not argv:
+            return []
+        result = run_mojo(mojo_template, use_cache=True, extra_args=argv, raw_output=raw_output)
+        return _convert_result(result, list[sig.return_annotation])
+
+    wrapper.precompile = precompile  # type: ignore[attr-defined]
+    wrapper.batch = batch  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+
+    return _register(wrapper, (mojo_template, False))
+
+
+class _RunFailed(Exception):
+    """A memoised call's run failed: its output must not be cached."""
+
+
+def _hashable(args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+    """Whether the arguments can key the memo (e.g. no lists)."""
+    try:
+        hash((args, tuple(kwargs.values())))
+    except TypeError:
+        return False
+    return True
+
+
+def _result_key(mojo_code: str, argv: list[str]) -> str:
+    """Return the stored-output key for running ``mojo_code`` with ``argv``."""
+    return executor._cache_hash("\0".join([mojo_code, *argv]))
+
+
+def _results_db() -> sqlite3.Connection:
+    """Open the store of persisted outputs, creating it if needed.
+
+    A connection per call keeps threads independent and survives
+    ``clear_cache()`` deleting the file; WAL mode lets notebooks in other
+    processes read while one writes.
+    """
+    db = sqlite3.connect(executor.CACHE_DIR / "results.sqlite", timeout=5)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, output)")
+    return db
+
+
+def _load_result(key: str) -> str | bytes | None:
+    """Return the persisted output for ``key``, or None if there is none."""
+    try:
+        with closing(_results_db()) as db:
+            row = db.execute("SELECT output FROM results WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _store_result(key: str, output: str | bytes) -> None:
+    """Persist ``output`` for ``key``; failures only cost a later re-run."""
+    try:
+        with closing(_results_db()) as db, db:
+            db.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (key, output))
+    except sqlite3.Error:
+        pass
+
+
+def _register(wrapper: Callable[..., Any], key: tuple[str, bool]) -> Callable[..., Any]:
+    """Record a decorated function, prewarming it if enabled.
+
+    A later function with the same template and kind replaces it, as both
+    would compile the same binary.
+    """
+    _REGISTERED[key] = wrapper
+    if PREWARM:
+        prewarm([wrapper])
+    return wrapper
+
+
+def prewarm(funcs: Iterable[Callable[..., Any] | str] | None = None, wait: bool = False) -> None:
+    """Compile decorated functions in background threads, several at a time.
+
+    Moves the one-off compile off the caller's critical path: a later call
+    finds the binary already cached (or waits on nothing but its own run).
+    Templates with placeholders are skipped, since their source depends on
+    the arguments.
+
+    Args:
+        funcs: Decorated functions to compile (default: every one still in use).
+               Mojo code strings or file paths are compiled as ``run_mojo``
+               would, so executor-style notebooks can warm their sources too.
+        wait: Block until every queued compile has finished.
+    """
+    for func in list(_REGISTERED.values()) if funcs is None else funcs:
+        if isinstance(func, str):
+            _prewarm_queue.put(partial(compile_mojo, func))
+        else:
+            _prewarm_queue.put(func.precompile)  # type: ignore[attr-defined]
+
+    with _prewarm_lock:
+        while len(_prewarm_threads) < PREWARM_THREADS:
+            thread = threading.Thread(
+                target=_prewarm_worker,
+                name=f"py-run-mojo-prewarm-{len(_prewarm_threads)}",
+                daemon=True,
+            )
+            thread.start()
+            _prewarm_threads.append(thread)
+
+    if wait:
+        _prewarm_queue.join()
+
+
+def _prewarm_worker() -> None:
+    """Run queued precompile jobs forever (daemon threads)."""
+    while True:
+        precompile = _prewarm_queue.get()
+        try:
+            precompile()
+        except Exception as e:
+            print(f"Prewarm error: {e}")
+        finally:
+            _prewarm_queue.task_done()
+
+
+def _native_wrapper(
+    func: Callable[..., Any],
+    mojo_template: str,
+    sig: inspect.Signature,
+    placeholders: set[str],
+) -> Callable[..., Any]:
+    """Build the ``ctypes`` call wrapper for ``@mojo(native=True)``."""
+    if placeholders:
+        raise ValueError(f"Native function {func.__name__} cannot use {{{{param}}}} placeholders")
+
+    try:
+        argtypes = [_CTYPES[param.annotation] for param in sig.parameters.values()]
+        restype = _CTYPES[sig.return_annotation]
+    except KeyError as e:
+        raise ValueError(
+            f"Native function {func.__name__} has unsupported type annotation {e}"
+        ) from None
+
+    # Resolved C function, loaded lazily on the first call
+    c_func: Any = None
+
+    def load() -> bool:
+        nonlocal c_func
+        if c_func is None:
+            library = load_mojo_library(mojo_template)
+            if library is None:
+                return False
+            try:
+                symbol = getattr(library, func.__name__)
+            except AttributeError:
+                print(f"### Shared library has no exported function {func.__name__!r}")
+                return False
+            # Publish only once fully typed, as prewarming may load concurrently
+            symbol.argtypes = argtypes
+            symbol.restype = restype
+            c_func = symbol
+        return True
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        if not load():
+            return _convert_result(None, sig.return_annotation)
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return c_func(*bound.args)
+
+    wrapper.precompile = load  # type: ignore[attr-defined]
+
     return wrapper
 
 
+def _to_argv(value: Any) -> list[str]:
+    """Flatten a parameter value into command-line arguments."""
+    if isinstance(value, list | tuple):
+        return [arg for item in value for arg in _to_argv(item)]
+    return [str(value)]
+
+
+def _parses_bytes(return_type: Any) -> bool:
+    """Whether results of ``return_type`` can be parsed from undecoded stdout.
+
+    Numbers and bools are ASCII, and ``int``/``float`` accept bytes directly,
+    so decoding stdout to ``str`` first would only add a copy per line.
+    """
+    if get_origin(return_type) is list:
+        return_type = (get_args(return_type) or (str,))[0]
+    return return_type in (bytes, int, bool, float)
+
+
+def _convert_result(result: str | bytes | None, return_type: Any) -> Any:
+    """Convert Mojo stdout (text or raw bytes) to the annotated Python return type."""
+    if return_type is bytes:
+        return result or b""
+    if get_origin(return_type) is list:
+        item_type = (get_args(return_type) or (str,))[0]
+        if not result:
+            return []
+        return [_convert_result(line, item_type) for line in result.splitlines()]
+    if return_type is int:
+        return int(result) if result else 0
+    if return_type is bool:
+        return result.strip() in ("True", b"True") if result else False
+    if return_type is float:
+        return float(result) if result else 0.0
+    return result
+
+
 # Example decorated functions
 
 
 @mojo
 def fibonacci(n: int) -> int:
     """
+    from sys import argv
+
     fn fibonacci(n: Int) -> Int:
         if n <= 1:
             return n
@@ -102,8 +515,8 @@ def fibonacci(n: int) -> int:
             curr = next_val
         return curr
 
-    fn main():
-        print(fibonacci({{n}}))
+    fn main() raises:
+        print(fibonacci(atol(argv()[1])))
     """
     ...
 
@@ -111,14 +524,16 @@ def fibonacci(n: int) -> int:
 @mojo
 def sum_squares(n: int) -> int:
     """
+    from sys import argv
+
     fn sum_squares(n: Int) -> Int:
         var total: Int = 0
         for i in range(1, n + 1):
             total += i * i
         return total
 
-    fn main():
-        print(sum_squares({{n}}))
+    fn main() raises:
+        print(sum_squares(atol(argv()[1])))
     """
     ...
 
@@ -126,6 +541,8 @@ def sum_squares(n: int) -> int:
 @mojo
 def is_prime(n: int) -> bool:
     """
+    from sys import argv
+
     fn is_prime(n: Int) -> Bool:
         if n < 2:
             return False
@@ -140,8 +557,8 @@ def is_prime(n: int) -> bool:
             i += 2
         return True
 
-    fn main():
-        print(is_prime({{n}}))
+    fn main() raises:
+        print(is_prime(atol(argv()[1])))
     """
     ...
 
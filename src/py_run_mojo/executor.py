@@ -4,19 +4,60 @@ The executor compiles Mojo code once and caches the binary, making subsequent
 executions much faster (~10-50ms vs ~1-2s).
 """
 
+import ctypes
 import hashlib
+import os
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from functools import cache
 from pathlib import Path
 from textwrap import dedent
+from typing import Literal, overload
 
 from py_run_mojo.validator import get_validation_hint, validate_mojo_code
 
-# Cache directory for compiled Mojo binaries
-CACHE_DIR = Path.home() / ".mojo_cache" / "binaries"
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# BLAKE3 hashes large sources several times faster than SHA256; it is optional
+# (pip install py-run-mojo[fast]) and keys fall back to SHA256 without it.
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+
+# Cache directory for compiled Mojo binaries. Set PY_RUN_MOJO_CACHE_DIR to
+# keep it somewhere else, e.g. a directory that CI saves between runs.
+CACHE_DIR = Path(
+    os.environ.get("PY_RUN_MOJO_CACHE_DIR") or Path.home() / ".mojo_cache" / "binaries"
+).expanduser()
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Entries this package writes to CACHE_DIR. clear_cache() removes only these,
+# since the directory may be shared with other files.
+_CACHE_ENTRIES = ("mojo_*", ".tmp-*", ".mojo_*.lock", "results.sqlite*")
+
+# Mojo executable, resolved once so launches don't search PATH every time.
+# Set MOJO_BIN to use a specific toolchain.
+MOJO_BIN = os.environ.get("MOJO_BIN") or shutil.which("mojo") or "mojo"
+
+# Source files only live for one build, so keep them in memory-backed /dev/shm
+# where available instead of the (possibly disk-backed) default temp directory.
+# They still need a real path with a .mojo suffix for the compiler.
+_SOURCE_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+# Inline sources already compiled by this process, mapped to their binaries
+_compiled: dict[tuple[str, bool], Path] = {}
+
 
 @cache
 def get_mojo_version() -> str:
@@ -48,7 +89,7 @@ def get_mojo_version() -> str:
     # 2. Fallback: shell out to the CLI, but only trust sane output.
     try:
         result = subprocess.run(
-            ["mojo", "--version"],
+            [MOJO_BIN, "--version"],
             capture_output=True,
             text=True,
             check=False,
@@ -68,40 +109,129 @@ def get_mojo_version() -> str:
     return stdout
 
 
-def run_mojo(
+def _source_file(source: str) -> Path | None:
+    """Return ``source`` as a path if it names an existing file, else None.
+
+    Inline programs always span several lines, so only a single-line source
+    is worth a stat; a long string would also fail one with ``OSError``.
+    """
+    if "\n" in source:
+        return None
+    path = Path(source)
+    try:
+        return path if path.is_file() else None
+    except OSError:
+        return None
+
+
+def _cache_hash(mojo_code: str) -> str:
+    """Return the cache key hash for ``mojo_code`` under the current toolchain."""
+    hasher = _hasher()
+    hasher.update(get_mojo_version().encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(mojo_code.encode("utf-8"))
+    return hasher.hexdigest()[:16]
+
+
+@contextmanager
+def _build_lock(cache_key: str) -> Iterator[None]:
+    """Hold an exclusive lock on ``cache_key`` while it is built.
+
+    ``flock`` works between processes and between threads (each opens its own
+    file), so notebooks sharing the cache never compile the same source twice
+    at once. Without ``fcntl`` (Windows) builds simply aren't serialised.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(CACHE_DIR / f".{cache_key}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield  # closing the file releases the lock
+
+
+def _build_binary(mojo_code: str, cached_binary: Path, shared_lib: bool) -> bool:
+    """Compile ``mojo_code`` to ``cached_binary``, returning whether it succeeded."""
+    # Write source to temp file
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".mojo", dir=_SOURCE_DIR, delete=False
+    ) as tmp:
+        tmp.write(mojo_code)
+        source_file = tmp.name
+
+    # Build under a unique temporary name and rename into place, so a
+    # crash or a concurrent build never leaves a partial binary that a
+    # later run would mistake for a cache hit
+    partial_binary = CACHE_DIR / f".tmp-{os.getpid()}-{threading.get_ident()}-{cached_binary.name}"
+
+    try:
+        # Compile to binary
+        compile_cmd = [MOJO_BIN, "build", source_file, "-o", str(partial_binary)]
+        if shared_lib:
+            compile_cmd[3:3] = ["--emit", "shared-lib"]
+        try:
+            compile_result = subprocess.run(
+                compile_cmd,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            print(f"### Mojo compiler not found: {MOJO_BIN} (install Mojo or set MOJO_BIN)")
+            return False
+
+        if compile_result.returncode != 0:
+            print(f"### Compilation failed:\n{compile_result.stderr}")
+            return False
+
+        os.replace(partial_binary, cached_binary)
+        return True
+
+    finally:
+        Path(source_file).unlink(missing_ok=True)
+        partial_binary.unlink(missing_ok=True)
+
+
+def compile_mojo(
     source: str,
     echo_code: bool = False,
     echo_output: bool = False,
     use_cache: bool = True,
-    extra_args: list[str] | None = None,
-) -> str | None:
-    """Execute Mojo code with optional binary caching.
+    shared_lib: bool = False,
+) -> Path | None:
+    """Validate and compile Mojo code, returning the path to the binary.
 
     Args:
         source: Mojo code string or file path.
-        echo_code: Print the code before running.
-        echo_output: Print the output after running.
-        use_cache: Use cached binaries for faster repeated execution (default True).
+        echo_code: Print the code before compiling.
+        echo_output: Print cache hit/miss information.
+        use_cache: Reuse a previously cached binary if present (default True).
                    Set to False to always recompile.
-        extra_args: Optional list of extra arguments.
+        shared_lib: Build a shared library (``--emit shared-lib``) instead of
+                    an executable, for loading with ``load_mojo_library``.
 
     Returns:
-        The stdout output if successful, else None.
-
-    Example:
-        >>> code = '''\n        ... fn main():\n        ...     print("Hello from Mojo!")\n        ... '''\n        >>> output = run_mojo(code)
-        >>> print(output)
-        Hello from Mojo!
+        The path to the compiled binary if successful, else None.
     """
+    # Warm path: an inline source built earlier in this process goes straight
+    # to its binary, skipping the read/dedent/validate/hash work below
+    memo_key = (source, shared_lib)
+    if use_cache and not echo_code:
+        known_binary = _compiled.get(memo_key)
+        if known_binary is not None and known_binary.exists():
+            if echo_output:
+                print(f"[Using cached binary {known_binary.name}]")
+            return known_binary
+
     if not source.strip():
         print("Error: Empty source provided.")
         return None
 
-    path = Path(source)
+    path = _source_file(source)
+    from_file = path is not None
     mojo_code: str
 
     # Read or use source code
-    if path.is_file():
+    if path is not None:
         try:
             mojo_code = path.read_text()
         except OSError as e:
@@ -128,40 +258,230 @@ def run_mojo(
             print(hint)
         return None
 
-    # Generate cache key from source code hash
-    code_hash = hashlib.sha256(mojo_code.encode("utf-8")).hexdigest()[:16]
-    cache_key = f"mojo_{code_hash}"
+    # Generate cache key from source code hash, salted with the toolchain
+    # version so binaries built by an older Mojo are not reused after upgrades
+    code_hash = _cache_hash(mojo_code)
+    cache_key = f"mojo_{code_hash}.so" if shared_lib else f"mojo_{code_hash}"
     cached_binary = CACHE_DIR / cache_key
 
-    # Compile if not cached
-    if not use_cache or not cached_binary.exists():
-        if use_cache and echo_output:
-            print(f"[Compiling and caching as {cache_key}...]")
+    # Compile if not cached. Builds of the same source are serialised across
+    # threads and processes, so whoever waited finds the finished binary
+    # instead of compiling it a second time.
+    if not use_cache:
+        if not _build_binary(mojo_code, cached_binary, shared_lib):
+            return None
+    elif not cached_binary.exists():
+        with _build_lock(cache_key):
+            if not cached_binary.exists():
+                if echo_output:
+                    print(f"[Compiling and caching as {cache_key}...]")
+                if not _build_binary(mojo_code, cached_binary, shared_lib):
+                    return None
+    elif echo_output:
+        print(f"[Using cached binary {cache_key}]")
+
+    # Files are re-read every time, since their contents may change on disk
+    if use_cache and not from_file:
+        _compiled[memo_key] = cached_binary
+
+    return cached_binary
 
-        # Write source to temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".mojo", delete=False) as tmp:
-            tmp.write(mojo_code)
-            source_file = tmp.name
 
+# Loaded shared libraries, keyed by cached library path
+_libraries: dict[Path, ctypes.CDLL] = {}
+
+
+def load_mojo_library(
+    source: str, echo_output: bool = False, use_cache: bool = True
+) -> ctypes.CDLL | None:
+    """Compile Mojo code to a shared library and load it with ``ctypes``.
+
+    Functions marked ``@export`` in the source become C symbols on the
+    returned library, so calling them is a direct function call with no
+    process start-up or stdout parsing. Set ``argtypes``/``restype`` on each
+    symbol before calling it, e.g. ``ctypes.c_int64`` for ``Int``.
+
+    Args:
+        source: Mojo code string or file path.
+        echo_output: Print cache hit/miss information.
+        use_cache: Reuse a previously cached library if present (default True).
+
+    Returns:
+        The loaded library if successful, else None.
+    """
+    library_path = compile_mojo(
+        source, echo_output=echo_output, use_cache=use_cache, shared_lib=True
+    )
+    if library_path is None:
+        return None
+
+    library = _libraries.get(library_path)
+    if library is None:
         try:
-            # Compile to binary
-            compile_cmd = ["mojo", "build", source_file, "-o", str(cached_binary)]
-            compile_result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            library = _libraries[library_path] = ctypes.CDLL(str(library_path))
+        except OSError as e:
+            print(f"Error loading shared library {library_path}: {e}")
+            return None
+    return library
 
-            if compile_result.returncode != 0:
-                print(f"### Compilation failed:\n{compile_result.stderr}")
-                return None
 
-        finally:
-            Path(source_file).unlink(missing_ok=True)
+_output_buffers = threading.local()
 
-    elif echo_output:
-        print(f"[Using cached binary {cache_key}]")
+
+def _close_fds(fds: tuple[int, ...]) -> None:
+    for fd in fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+class _OutputBuffers:
+    """One thread's output files, closed once the thread exits.
+
+    A thread's ``threading.local`` attributes are released when it ends, and
+    the finalizer then closes the descriptors, so thread pools don't leak two
+    descriptors per thread that ever ran Mojo.
+    """
+
+    def __init__(self, fds: tuple[int, int]):
+        self.fds = fds
+        weakref.finalize(self, _close_fds, fds)
+
+
+def _output_buffer_fds() -> tuple[int, int] | None:
+    """Return this thread's in-memory (stdout, stderr) files, or None if unsupported.
+
+    Child output goes into anonymous memory files (Linux ``memfd_create``)
+    that are truncated and reused for every run, rather than a fresh pair of
+    pipes per call that has to be drained while the process runs.
+    """
+    if not hasattr(os, "memfd_create"):
+        return None
+    buffers = getattr(_output_buffers, "buffers", None)
+    if buffers is None:
+        try:
+            stdout_fd = os.memfd_create("py_run_mojo_stdout", os.MFD_CLOEXEC)
+        except OSError:
+            return None
+        try:
+            stderr_fd = os.memfd_create("py_run_mojo_stderr", os.MFD_CLOEXEC)
+        except OSError:
+            os.close(stdout_fd)
+            return None
+        buffers = _output_buffers.buffers = _OutputBuffers((stdout_fd, stderr_fd))
+    return buffers.fds
+
+
+def _reset_buffer(fd: int) -> None:
+    """Empty an output buffer and rewind it for the next run."""
+    os.ftruncate(fd, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+
+
+def _read_buffer(fd: int) -> bytes:
+    """Read everything written to an output buffer."""
+    return os.pread(fd, os.fstat(fd).st_size, 0)
+
+
+def _run_binary(run_cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
+    """Run a compiled binary and capture its stdout and stderr as bytes.
+
+    ``close_fds=False`` lets ``subprocess`` launch with ``posix_spawn`` rather
+    than fork + exec, skipping the scan of every open descriptor on each run.
+    Python opens descriptors non-inheritable by default, so the child still
+    only receives its standard streams.
+    """
+    fds = _output_buffer_fds()
+    if fds is None:
+        return subprocess.run(run_cmd, capture_output=True, close_fds=False, check=False)
+
+    # Reset before the run as well as after it: an interrupted run (e.g.
+    # KeyboardInterrupt) may have left partial output that must not be
+    # prepended to this run's
+    stdout_fd, stderr_fd = fds
+    for fd in fds:
+        _reset_buffer(fd)
+    try:
+        process = subprocess.run(
+            run_cmd, stdout=stdout_fd, stderr=stderr_fd, close_fds=False, check=False
+        )
+        return subprocess.CompletedProcess(
+            run_cmd, process.returncode, _read_buffer(stdout_fd), _read_buffer(stderr_fd)
+        )
+    finally:
+        for fd in fds:
+            _reset_buffer(fd)
+
+
+@overload
+def run_mojo(
+    source: str,
+    echo_code: bool = False,
+    echo_output: bool = False,
+    use_cache: bool = True,
+    extra_args: list[str] | None = None,
+    raw_output: Literal[False] = False,
+) -> str | None: ...
+
+
+@overload
+def run_mojo(
+    source: str,
+    echo_code: bool = False,
+    echo_output: bool = False,
+    use_cache: bool = True,
+    extra_args: list[str] | None = None,
+    *,
+    raw_output: Literal[True],
+) -> bytes | None: ...
+
+
+@overload
+def run_mojo(
+    source: str,
+    echo_code: bool = False,
+    echo_output: bool = False,
+    use_cache: bool = True,
+    extra_args: list[str] | None = None,
+    raw_output: bool = False,
+) -> str | bytes | None: ...
+
+
+def run_mojo(
+    source: str,
+    echo_code: bool = False,
+    echo_output: bool = False,
+    use_cache: bool = True,
+    extra_args: list[str] | None = None,
+    raw_output: bool = False,
+) -> str | bytes | None:
+    """Execute Mojo code with optional binary caching.
+
+    Args:
+        source: Mojo code string or file path.
+        echo_code: Print the code before running.
+        echo_output: Print the output after running.
+        use_cache: Use cached binaries for faster repeated execution (default True).
+                   Set to False to always recompile.
+        extra_args: Optional list of extra arguments.
+        raw_output: Return stdout as undecoded bytes, exactly as written, for
+                    programs that emit a binary format instead of text.
+
+    Returns:
+        The stdout output (stripped text, or bytes if ``raw_output``) if
+        successful, else None.
+
+    Example:
+        >>> code = '''\n        ... fn main():\n        ...     print("Hello from Mojo!")\n        ... '''\n        >>> output = run_mojo(code)
+        >>> print(output)
+        Hello from Mojo!
+    """
+    cached_binary = compile_mojo(
+        source, echo_code=echo_code, echo_output=echo_output, use_cache=use_cache
+    )
+    if cached_binary is None:
+        return None
 
     # Run the cached binary
     run_cmd = [str(cached_binary)]
@@ -169,21 +489,16 @@ def run_mojo(
         run_cmd.extend(extra_args)
 
     try:
-        result = subprocess.run(
-            run_cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = _run_binary(run_cmd)
 
-        output: str | None = None
+        output: str | bytes | None = None
         if result.stdout:
-            output = result.stdout.strip()
+            output = result.stdout if raw_output else result.stdout.decode().strip()
             if echo_output:
-                print(f"\n### Output - {get_mojo_version()}:\n{output}")
+                print(f"\n### Output - {get_mojo_version()}:\n{output!s}")
 
         if result.stderr:
-            print(f"\n### Runtime errors:\n{result.stderr}")
+            print(f"\n### Runtime errors:\n{result.stderr.decode(errors='replace')}")
 
         if result.returncode != 0:
             return None
@@ -198,30 +513,211 @@ def run_mojo(
         return None
 
 
-def clear_cache():
-    """Clear all cached Mojo binaries."""
-    import shutil
+def stream_mojo(
+    source: str,
+    echo_code: bool = False,
+    echo_output: bool = False,
+    use_cache: bool = True,
+    extra_args: list[str] | None = None,
+    on_line: Callable[[str], object] | None = None,
+) -> str | None:
+    """Execute Mojo code, handing over each line of output as it is printed.
+
+    ``run_mojo`` only returns once the program has exited; this reads stdout
+    while the program runs, so long-running programs can report progress.
+    Mojo buffers output written to a pipe, so print with ``flush=True`` for
+    lines to arrive promptly. Takes the same arguments as ``run_mojo``, so it
+    can be passed wherever a ``run_mojo``-style callable is expected.
 
+    Args:
+        on_line: Called with each line (without its newline) as it arrives.
+                 Defaults to ``print`` when ``echo_output`` is set.
+
+    Returns:
+        The complete stdout output (stripped) if successful, else None.
+    """
+    cached_binary = compile_mojo(
+        source, echo_code=echo_code, echo_output=echo_output, use_cache=use_cache
+    )
+    if cached_binary is None:
+        return None
+
+    if on_line is None and echo_output:
+        print(f"\n### Output - {get_mojo_version()}:")
+        on_line = print
+
+    run_cmd = [str(cached_binary), *(extra_args or [])]
+    lines: list[str] = []
+
+    # stderr goes to a file so a chatty program can't fill a pipe and stall
+    # while only stdout is being drained
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            with subprocess.Popen(
+                run_cmd, stdout=subprocess.PIPE, stderr=stderr, text=True, close_fds=False
+            ) as process:
+                assert process.stdout is not None
+                for line in process.stdout:
+                    line = line.rstrip("\n")
+                    lines.append(line)
+                    if on_line is not None:
+                        on_line(line)
+        except OSError as e:
+            print(f"Subprocess error: {e}")
+            return None
+
+        stderr.seek(0)
+        errors = stderr.read()
+
+    if errors:
+        print(f"\n### Runtime errors:\n{errors.decode(errors='replace')}")
+
+    if process.returncode != 0:
+        return None
+
+    return "\n".join(lines).strip() or None
+
+
+# Timing harness appended by ``benchmark_mojo``: arguments arrive on the
+# command line so the compiler cannot fold the call away, and ``keep`` stops
+# it from discarding the unused result
+_BENCHMARK_IMPORTS = """\
+from benchmark import keep
+from math import sqrt
+from sys import argv
+from time import perf_counter_ns
+"""
+
+_BENCHMARK_MAIN = """
+fn main() raises:
+    var args = argv()
+    var runs = atol(args[1])
+{parse_args}
+    var first: Int = 0
+    var min_ns: Int = Int.MAX
+    var total: Float64 = 0
+    var total_sq: Float64 = 0
+    for i in range(runs):
+        var start = perf_counter_ns()
+        keep({call})
+        var elapsed = Int(perf_counter_ns() - start)
+        if i == 0:
+            first = elapsed
+        min_ns = min(min_ns, elapsed)
+        total += Float64(elapsed)
+        total_sq += Float64(elapsed) * Float64(elapsed)
+    var mean = total / Float64(runs)
+    var variance = (total_sq - total * mean) / Float64(max(runs - 1, 1))
+    print(first, min_ns, mean, sqrt(max(variance, 0.0)))
+"""
+
+
+def benchmark_mojo(
+    source: str,
+    func_name: str,
+    args: tuple[int, ...] | list[int] = (),
+    runs: int = 1000,
+) -> dict[str, float] | None:
+    """Time a Mojo function inside a single Mojo process.
+
+    Timing from Python measures process start-up and output parsing as much
+    as the Mojo code itself. This builds a harness ``main()`` that calls
+    ``func_name(*args)`` ``runs`` times and times each call with the Mojo
+    clock, so the whole measurement costs one run of one cached binary.
+
+    Args:
+        source: Mojo code string or file path defining the function. Any
+                ``main()`` it has is replaced by the harness.
+        func_name: Name of the Mojo function to time.
+        args: Integer arguments for each call.
+        runs: Number of timed calls.
+
+    Returns:
+        ``first_ms`` (the first call, on its own), ``min_ms``, ``mean_ms``,
+        ``stdev_ms`` and ``runs`` if successful, else None.
+    """
+    if runs < 1:
+        print("Error: runs must be at least 1.")
+        return None
+
+    path = _source_file(source)
+    if path is None:
+        mojo_code = dedent(source)
+    else:
+        try:
+            mojo_code = path.read_text()
+        except OSError as e:
+            print(f"Error reading file {path}: {e}")
+            return None
+    mojo_code = re.sub(r"^(?:fn|def) main\(.*?(?=^\S|\Z)", "", mojo_code, flags=re.M | re.S)
+
+    arg_names = [f"arg{i}" for i in range(len(args))]
+    harness = _BENCHMARK_MAIN.format(
+        parse_args="\n".join(
+            f"    var {name} = atol(args[{i + 2}])" for i, name in enumerate(arg_names)
+        ),
+        call=f"{func_name}({', '.join(arg_names)})",
+    )
+
+    output = run_mojo(
+        _BENCHMARK_IMPORTS + mojo_code + harness,
+        extra_args=[str(runs), *(str(arg) for arg in args)],
+    )
+    if output is None:
+        return None
+
+    try:
+        first_ns, min_ns, mean_ns, stdev_ns = (float(value) for value in output.split())
+    except ValueError:
+        print(f"Unexpected benchmark output: {output!r}")
+        return None
+
+    return {
+        "first_ms": first_ns / 1e6,
+        "min_ms": min_ns / 1e6,
+        "mean_ms": mean_ns / 1e6,
+        "stdev_ms": stdev_ns / 1e6,
+        "runs": runs,
+    }
+
+
+def clear_cache():
+    """Clear all cached Mojo binaries and persisted results."""
+    _compiled.clear()
     if CACHE_DIR.exists():
-        shutil.rmtree(CACHE_DIR)
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for pattern in _CACHE_ENTRIES:
+            for entry in CACHE_DIR.glob(pattern):
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink(missing_ok=True)
         print(f"Cache cleared: {CACHE_DIR}")
     else:
         print("Cache directory doesn't exist")
 
 
-def cache_stats():
-    """Show cache statistics."""
-    if not CACHE_DIR.exists():
-        print("Cache directory doesn't exist")
-        return
+def cache_stats(return_str: bool = False) -> str | None:
+    """Show cache statistics.
 
-    binaries = list(CACHE_DIR.glob("mojo_*"))
-    total_size = sum(b.stat().st_size for b in binaries)
+    Args:
+        return_str: Return the statistics as a string instead of printing
+                    them, e.g. for display in a notebook cell.
+    """
+    if not CACHE_DIR.exists():
+        stats = "Cache directory doesn't exist"
+    else:
+        binaries = list(CACHE_DIR.glob("mojo_*"))
+        total_size = sum(b.stat().st_size for b in binaries)
+        stats = (
+            f"Cache directory: {CACHE_DIR}\n"
+            f"Cached binaries: {len(binaries)}\n"
+            f"Total size: {total_size / 1024 / 1024:.2f} MB"
+        )
 
-    print(f"Cache directory: {CACHE_DIR}")
-    print(f"Cached binaries: {len(binaries)}")
-    print(f"Total size: {total_size / 1024 / 1024:.2f} MB")
+    if return_str:
+        return stats
+    print(stats)
+    return None
 
 
 if __name__ == "__main__":
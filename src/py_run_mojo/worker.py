@@ -0,0 +1,201 @@
+"""Long-lived Mojo worker process for low-latency repeated calls.
+
+Even with a cached binary, every ``run_mojo`` call pays for process creation
+and Mojo runtime start-up. A worker compiles its program once, starts it once,
+and then exchanges one request line and one response line per call over
+stdin/stdout, so repeated calls only cost a pipe round trip.
+
+The Mojo program must loop reading requests with ``input()`` and answer each
+with exactly one ``print(..., flush=True)`` line, exiting when stdin closes.
+
+``get_worker`` returns a shared worker per program, so independent callers
+reuse one process; all shared workers are closed at interpreter exit.
+"""
+
+import atexit
+import subprocess
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from py_run_mojo.executor import compile_mojo
+
+
+class MojoWorker:
+    """A persistent Mojo process answering one request per line.
+
+    Usage:
+        with MojoWorker("benchmarks/worker.mojo") as worker:
+            worker.call("fibonacci", 30)  # -> "832040"
+
+    Each call writes its arguments space-separated on a single line and
+    returns the next line of output (without the trailing newline). The
+    process is started lazily on first use and restarted if it has exited.
+    Calls are serialised by a lock, so threads can share one worker without
+    reading each other's responses.
+    """
+
+    def __init__(self, source: str, use_cache: bool = True):
+        """
+        Args:
+            source: Mojo code string or file path of the worker program.
+            use_cache: Reuse a cached binary for the worker (default True).
+        """
+        self.source = source
+        self.use_cache = use_cache
+        self._process: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process is currently alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> bool:
+        """Compile (or reuse) the worker binary and start the process.
+
+        Returns:
+            True if the worker is running, False if compilation failed.
+        """
+        if self.running:
+            return True
+
+        binary = compile_mojo(self.source, use_cache=self.use_cache)
+        if binary is None:
+            return False
+
+        self._process = subprocess.Popen(
+            [str(binary)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        return True
+
+    def call(self, *args: Any) -> str | None:
+        """Send one request line to the worker and return its response line.
+
+        Returns:
+            The response line if successful, else None.
+        """
+        with self._lock:
+            if not self.start():
+                return None
+
+            process = self._process
+            assert process is not None and process.stdin and process.stdout
+
+            try:
+                process.stdin.write(" ".join(str(arg) for arg in args) + "\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except OSError as e:
+                print(f"Worker error: {e}")
+                self.close()
+                return None
+
+            if not line:
+                print(f"Worker exited with code {process.poll()}")
+                self.close()
+                return None
+
+        return line.rstrip("\n")
+
+    def call_many(self, requests: Iterable[Sequence[Any]]) -> list[str] | None:
+        """Send many requests at once and return their response lines in order.
+
+        A writer thread feeds every request line while this thread reads the
+        responses, so the worker never waits on Python between requests and
+        neither side can block on a full pipe.
+
+        Returns:
+            One response line per request if successful, else None.
+        """
+        lines = [" ".join(str(arg) for arg in args) + "\n" for args in requests]
+        if not lines:
+            return []
+
+        with self._lock:
+            if not self.start():
+                return None
+
+            process = self._process
+            assert process is not None and process.stdin and process.stdout
+            stdin = process.stdin
+
+            def feed() -> None:
+                try:
+                    stdin.writelines(lines)
+                    stdin.flush()
+                except OSError:
+                    pass  # The worker exited: reported below as missing responses
+
+            writer = threading.Thread(target=feed, daemon=True)
+            writer.start()
+            responses = []
+            for _ in lines:
+                line = process.stdout.readline()
+                if not line:
+                    break
+                responses.append(line.rstrip("\n"))
+            writer.join()
+
+            if len(responses) < len(lines):
+                print(f"Worker exited with code {process.poll()}")
+                self.close()
+                return None
+
+        return responses
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the worker process, closing stdin so it can exit cleanly."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if process.stdin:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout:
+            process.stdout.close()
+
+    def __enter__(self) -> "MojoWorker":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Shared workers, one per worker program source
+_WORKERS: dict[str, MojoWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_worker(source: str) -> MojoWorker:
+    """Return the shared worker for ``source``, creating it on first use.
+
+    The process itself starts lazily on the first call and is closed
+    automatically when the interpreter exits.
+    """
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(source)
+        if worker is None:
+            worker = _WORKERS[source] = MojoWorker(source)
+        return worker
+
+
+@atexit.register
+def close_all_workers() -> None:
+    """Close every shared worker process."""
+    for worker in _WORKERS.values():
+        worker.close()
+    _WORKERS.clear()
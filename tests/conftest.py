@@ -1,6 +1,7 @@
 """Pytest configuration for mojo-marimo tests."""
 
 import subprocess
+from functools import cache
 
 import pytest
 
@@ -8,8 +9,10 @@ import pytest
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "requires_mojo: mark test as requiring mojo on PATH")
+    config.addinivalue_line("markers", "no_mojo: mark test as runnable without mojo")
 
 
+@cache
 def check_mojo_available():
     """Check if mojo command is available."""
     try:
@@ -23,9 +26,11 @@ def check_mojo_available():
         return False
 
 
-@pytest.fixture(scope="session", autouse=True)
-def check_mojo_env():
-    """Check if mojo is available and skip tests if not."""
+@pytest.fixture(autouse=True)
+def check_mojo_env(request):
+    """Check if mojo is available and skip tests if not (unless marked no_mojo)."""
+    if request.node.get_closest_marker("no_mojo"):
+        return
     if not check_mojo_available():
         pytest.skip(
             "Mojo not found on PATH. Install: curl https://get.modular.com | sh - && modular install mojo",
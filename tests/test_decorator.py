@@ -200,3 +200,352 @@ def test_decorator_prime_check(n, expected):
         ...
 
     assert is_prime(n) == expected
+
+
+def test_decorator_batches_via_argv():
+    """Test that non-placeholder params are passed as argv and list returns are parsed."""
+    from py_run_mojo import mojo
+
+    @mojo
+    def double_all(ns: list[int]) -> list[int]:
+        """
+        from sys import argv
+
+        fn main() raises:
+            var args = argv()
+            for i in range(1, len(args)):
+                print(atol(args[i]) * 2)
+        """
+        ...
+
+    assert double_all([1, 2, 3]) == [2, 4, 6]
+    assert double_all([]) == []
+
+
+def test_decorator_precompile():
+    """Test that argv-only templates can be compiled ahead of the first call."""
+    from py_run_mojo import mojo
+
+    @mojo
+    def square(n: int) -> int:
+        """
+        from sys import argv
+
+        fn main() raises:
+            var n = atol(argv()[1])
+            print(n * n)
+        """
+        ...
+
+    @mojo
+    def templated(n: int) -> int:
+        """
+        fn main():
+            print({{n}})
+        """
+        ...
+
+    assert square.precompile() is True
+    assert square(7) == 49
+    assert templated.precompile() is False
+
+
+def test_decorator_native():
+    """Test that native functions are called through a shared library."""
+    from py_run_mojo import mojo
+
+    @mojo(native=True)
+    def triple(n: int) -> int:
+        """
+        @export
+        fn triple(n: Int) -> Int:
+            return n * 3
+        """
+        ...
+
+    assert triple.precompile() is True
+    assert triple(5) == 15
+    assert triple(n=-4) == -12
+
+
+def test_decorator_native_rejects_placeholders():
+    """Test that native functions cannot use {{param}} placeholders."""
+    from py_run_mojo import mojo
+
+    with pytest.raises(ValueError):
+
+        @mojo(native=True)
+        def bad(n: int) -> int:
+            """
+            @export
+            fn bad() -> Int:
+                return {{n}}
+            """
+            ...
+
+
+def test_decorator_cache_key_ignores_function_identity():
+    """Test that identical Mojo code shares one binary regardless of the function."""
+    from py_run_mojo import mojo
+    from py_run_mojo.executor import CACHE_DIR, clear_cache
+
+    clear_cache()
+
+    @mojo
+    def first() -> int:
+        """
+        fn main():
+            print(7)
+        """
+        ...
+
+    def make_nested():
+        @mojo
+        def second() -> int:
+            """
+            fn main():
+                print(7)
+            """
+            ...
+
+        return second
+
+    assert first() == 7
+    assert make_nested()() == 7
+    assert len(list(CACHE_DIR.glob("mojo_*"))) == 1
+
+
+def test_decorator_batch():
+    """Test computing many results in one run with .batch()."""
+    from py_run_mojo import mojo
+
+    @mojo
+    def square(n: int) -> int:
+        """
+        from sys import argv
+
+        fn main() raises:
+            var args = argv()
+            for i in range(1, len(args)):
+                var n = atol(args[i])
+                print(n * n)
+        """
+        ...
+
+    assert square(3) == 9
+    assert square.batch([1, 2, 3]) == [1, 4, 9]
+    assert square.batch([]) == []
+
+
+def test_prewarm_compiles_in_background():
+    """Test that prewarm() caches the binary before the first call."""
+    from py_run_mojo import clear_cache, mojo, prewarm
+    from py_run_mojo.executor import CACHE_DIR
+
+    clear_cache()
+
+    @mojo
+    def answer() -> int:
+        """
+        fn main():
+            print(42)
+        """
+        ...
+
+    prewarm([answer], wait=True)
+    assert len(list(CACHE_DIR.glob("mojo_*"))) == 1
+    assert answer() == 42
+
+
+def test_prewarm_compiles_sources():
+    """Test that prewarm() also accepts Mojo source strings."""
+    from py_run_mojo import clear_cache, prewarm, run_mojo
+    from py_run_mojo.executor import CACHE_DIR
+
+    clear_cache()
+
+    code = """
+fn main():
+    print("warm")
+"""
+    prewarm([code], wait=True)
+    assert len(list(CACHE_DIR.glob("mojo_*"))) == 1
+    assert run_mojo(code) == "warm"
+
+
+def test_prewarm_registry_drops_unused_functions():
+    """Test that functions no longer in use aren't kept alive for prewarm()."""
+    import gc
+    from textwrap import dedent
+
+    from py_run_mojo import decorator, mojo
+
+    @mojo
+    def registered() -> str:
+        """
+        fn main():
+            print("registered")
+        """
+        ...
+
+    key = (dedent(registered.__doc__), False)
+    assert decorator._REGISTERED[key] is registered
+
+    # As when a notebook cell re-runs and rebinds the name
+    del registered
+    gc.collect()
+    assert key not in decorator._REGISTERED
+
+
+def test_decorator_memoizes_pure_results(monkeypatch):
+    """Test that repeated calls with the same arguments reuse the result."""
+    from py_run_mojo import decorator, mojo
+
+    @mojo
+    def double(n: int) -> int:
+        """
+        from sys import argv
+
+        fn main() raises:
+            print(atol(argv()[1]) * 2)
+        """
+        ...
+
+    assert double(21) == 42
+
+    # A memoised call must not run the binary again
+    monkeypatch.setattr(decorator, "run_mojo", lambda *args, **kwargs: None)
+    assert double(21) == 42
+
+    double.cache_clear()
+    assert double(21) == 0
+
+
+def test_decorator_does_not_memoize_failures(monkeypatch):
+    """Test that a failed run is retried, and list results aren't shared."""
+    from py_run_mojo import decorator, mojo
+
+    @mojo
+    def count_to(n: int) -> list[int]:
+        """
+        from sys import argv
+
+        fn main() raises:
+            for i in range(1, atol(argv()[1]) + 1):
+                print(i)
+        """
+        ...
+
+    run_mojo = decorator.run_mojo
+    monkeypatch.setattr(decorator, "run_mojo", lambda *args, **kwargs: None)
+    assert count_to(3) == []
+
+    monkeypatch.setattr(decorator, "run_mojo", run_mojo)
+    first = count_to(3)
+    assert first == [1, 2, 3]
+
+    # Mutating one caller's result must not change what the memo hands out
+    first.append(4)
+    assert count_to(3) == [1, 2, 3]
+
+
+def test_decorator_persists_results(tmp_path, monkeypatch):
+    """Test that persist=True reuses stored outputs after the memo is cleared."""
+    from py_run_mojo import decorator, executor, mojo
+
+    monkeypatch.setattr(executor, "CACHE_DIR", tmp_path)
+
+    @mojo(persist=True)
+    def triple(n: int) -> int:
+        """
+        from sys import argv
+
+        fn main() raises:
+            print(atol(argv()[1]) * 3)
+        """
+        ...
+
+    assert triple(14) == 42
+
+    # A new session starts with an empty memo but finds the stored output
+    triple.cache_clear()
+    monkeypatch.setattr(decorator, "run_mojo", lambda *args, **kwargs: None)
+    assert triple(14) == 42
+
+
+def test_decorator_worker_mode():
+    """Test that @mojo(worker=True) answers repeated calls from one process."""
+    from textwrap import dedent
+
+    from py_run_mojo import get_worker, mojo
+
+    @mojo(worker=True, cache_size=0)
+    def double(n: int) -> int:
+        """
+        fn main() raises:
+            while True:
+                var line: String
+                try:
+                    line = input()
+                except:
+                    break
+                print(atol(line) * 2, flush=True)
+        """
+        ...
+
+    assert double(21) == 42
+    pid = get_worker(dedent(double.__doc__))._process.pid
+    assert double.batch([1, 2, 3]) == [2, 4, 6]
+    assert get_worker(dedent(double.__doc__))._process.pid == pid
+
+
+def test_decorator_memoizes_worker_results(monkeypatch):
+    """Test that a worker's input() request loop doesn't make it impure."""
+    from py_run_mojo import decorator, mojo
+
+    @mojo(worker=True)
+    def triple(n: int) -> int:
+        """
+        fn main() raises:
+            while True:
+                var line: String
+                try:
+                    line = input()
+                except:
+                    break
+                print(atol(line) * 3, flush=True)
+        """
+        ...
+
+    assert triple(14) == 42
+
+    # A memoised call must not reach the worker again
+    monkeypatch.setattr(decorator, "get_worker", lambda source: None)
+    assert triple(14) == 42
+
+
+def test_benchmark_decorated_function():
+    """Test timing a decorated function's docstring, as interactive_learning.py does."""
+    from py_run_mojo import benchmark_mojo, mojo
+
+    @mojo
+    def sum_squares(n: int) -> int:
+        """
+        from sys import argv
+
+        fn sum_squares(n: Int) -> Int:
+            var total: Int = 0
+            for i in range(1, n + 1):
+                total += i * i
+            return total
+
+        fn main() raises:
+            print(sum_squares(atol(argv()[1])))
+        """
+        ...
+
+    # Longer than a file name, so it must be treated as inline code
+    assert len(sum_squares.__doc__) > 255
+    stats = benchmark_mojo(sum_squares.__doc__, "sum_squares", [10_000], runs=10)
+    assert stats is not None
+    assert stats["runs"] == 10
@@ -67,6 +67,100 @@ fn main():
     assert result1 == result2 == "no cache"
 
 
+def test_cache_key_includes_mojo_version(monkeypatch):
+    """Test that a toolchain upgrade invalidates cached binaries."""
+    from py_run_mojo import executor
+
+    code = """
+fn main():
+    print("versioned")
+"""
+    key = executor._cache_hash(code)
+    monkeypatch.setattr(executor, "get_mojo_version", lambda: "Mojo 0.0.0-test")
+
+    assert executor._cache_hash(code) != key
+
+
+def test_get_mojo_version_is_cached():
+    """Test that the version is looked up once per process, not once per call."""
+    from py_run_mojo.executor import get_mojo_version
+
+    get_mojo_version.cache_clear()
+    first = get_mojo_version()
+    assert get_mojo_version() is first
+    assert get_mojo_version.cache_info().misses == 1
+
+
+def test_stream_mojo_passes_lines_as_printed():
+    """Test that stream_mojo hands over each output line and returns them all."""
+    from py_run_mojo.executor import stream_mojo
+
+    code = """
+fn main():
+    for i in range(3):
+        print("line", i, flush=True)
+"""
+    seen = []
+    output = stream_mojo(code, on_line=seen.append)
+
+    assert seen == ["line 0", "line 1", "line 2"]
+    assert output == "line 0\nline 1\nline 2"
+
+
+def test_long_inline_source():
+    """Test that inline code longer than a file name is not stat'ed as a path."""
+    from py_run_mojo.executor import run_mojo
+
+    code = f"""
+fn main():
+    # {"x" * 300}
+    print("long")
+"""
+    assert run_mojo(code) == "long"
+
+
+def test_concurrent_compiles_build_once(tmp_path, monkeypatch):
+    """Test that simultaneous cache misses for one source compile it only once."""
+    import threading
+    import time
+
+    from py_run_mojo import executor
+
+    monkeypatch.setattr(executor, "CACHE_DIR", tmp_path)
+    builds = []
+
+    def slow_build(mojo_code, cached_binary, shared_lib):
+        builds.append(cached_binary)
+        time.sleep(0.2)
+        cached_binary.write_text("binary")
+        return True
+
+    monkeypatch.setattr(executor, "_build_binary", slow_build)
+
+    code = """
+fn main():
+    print("once")
+"""
+    threads = [threading.Thread(target=executor.compile_mojo, args=(code,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+
+
+def test_run_mojo_raw_output():
+    """Test that raw_output returns stdout bytes unmodified."""
+    from py_run_mojo.executor import run_mojo
+
+    code = """
+fn main():
+    print("raw")
+"""
+    assert run_mojo(code, raw_output=True) == b"raw\n"
+
+
 def test_clear_cache():
     """Test cache clearing functionality."""
     from py_run_mojo.executor import clear_cache, run_mojo
@@ -83,6 +177,28 @@ fn main():
     clear_cache()
 
 
+@pytest.mark.no_mojo
+def test_clear_cache_keeps_unrelated_files(tmp_path, monkeypatch):
+    """Test that clearing the cache leaves files it didn't create alone."""
+    from py_run_mojo import executor
+
+    monkeypatch.setattr(executor, "CACHE_DIR", tmp_path)
+    for name in (
+        "mojo_abc",
+        "mojo_abc.so",
+        ".tmp-1-2-mojo_abc",
+        ".mojo_abc.lock",
+        "results.sqlite",
+    ):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("keep me")
+    (tmp_path / "data").mkdir()
+
+    executor.clear_cache()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data", "notes.txt"]
+
+
 def test_cache_stats():
     """Test cache statistics functionality."""
     from py_run_mojo.executor import cache_stats, clear_cache
@@ -92,6 +208,8 @@ def test_cache_stats():
     # Should not raise even with empty cache
     cache_stats()
 
+    assert "Cached binaries: 0" in cache_stats(return_str=True)
+
 
 def test_get_mojo_version():
     """Test Mojo version retrieval."""
@@ -141,6 +259,39 @@ fn main(:
     assert result is None
 
 
+def test_compile_mojo_rebuilds_deleted_binary():
+    """Test that the in-process binary lookup notices a deleted binary."""
+    from py_run_mojo.executor import compile_mojo
+
+    code = """
+fn main():
+    print("rebuilt")
+"""
+
+    binary = compile_mojo(code)
+    assert binary is not None
+    assert compile_mojo(code) == binary
+
+    binary.unlink()
+    assert compile_mojo(code) == binary
+    assert binary.exists()
+
+
+def test_failed_compile_leaves_no_partial_binary():
+    """Test that a failed build leaves nothing behind in the cache."""
+    from py_run_mojo.executor import CACHE_DIR, clear_cache, compile_mojo
+
+    clear_cache()
+
+    code = """
+fn broken() -> Int:
+    return undefined_name
+"""
+
+    assert compile_mojo(code) is None
+    assert list(CACHE_DIR.iterdir()) == []
+
+
 @pytest.mark.parametrize(
     "n,expected",
     [
@@ -168,3 +319,98 @@ fn main():
 
     result = run_mojo(code)
     assert result == expected
+
+
+def test_load_mojo_library():
+    """Test loading exported Mojo functions with ctypes."""
+    import ctypes
+
+    from py_run_mojo import load_mojo_library
+
+    code = """
+@export
+fn add(a: Int, b: Int) -> Int:
+    return a + b
+"""
+    library = load_mojo_library(code)
+    assert library is not None
+    assert load_mojo_library(code) is library
+
+    library.add.argtypes = [ctypes.c_int64, ctypes.c_int64]
+    library.add.restype = ctypes.c_int64
+    assert library.add(2, 40) == 42
+
+
+def test_benchmark_mojo():
+    """Test timing a Mojo function inside a single Mojo process."""
+    from py_run_mojo import benchmark_mojo
+
+    code = """
+fn add(a: Int, b: Int) -> Int:
+    return a + b
+
+fn main():
+    print(add(1, 2))
+"""
+
+    stats = benchmark_mojo(code, "add", (2, 3), runs=50)
+    assert stats is not None
+    assert stats["runs"] == 50
+    assert 0 <= stats["min_ms"] <= stats["mean_ms"]
+    assert stats["first_ms"] >= stats["min_ms"]
+
+
+def test_benchmark_mojo_long_inline_source():
+    """Test that benchmarking inline code longer than a file name works."""
+    from py_run_mojo import benchmark_mojo
+
+    code = f"""
+fn add(a: Int, b: Int) -> Int:
+    # {"x" * 300}
+    return a + b
+"""
+
+    stats = benchmark_mojo(code, "add", (2, 3), runs=10)
+    assert stats is not None
+    assert stats["runs"] == 10
+
+
+@pytest.mark.no_mojo
+def test_interrupted_run_output_not_reused():
+    """Test that output left by an interrupted run isn't prepended to the next."""
+    import os
+
+    from py_run_mojo.executor import _output_buffer_fds, _run_binary
+
+    fds = _output_buffer_fds()
+    if fds is None:
+        pytest.skip("memfd_create is not available")
+
+    # What an interrupted run leaves behind: output written, never read
+    os.write(fds[0], b"stale-partial\n")
+
+    result = _run_binary(["sh", "-c", "printf '42\\n'"])
+    assert result.stdout == b"42\n"
+
+
+@pytest.mark.no_mojo
+def test_output_buffers_closed_when_thread_exits():
+    """Test that a thread's output buffer descriptors don't outlive it."""
+    import gc
+    import os
+    import threading
+
+    from py_run_mojo.executor import _output_buffer_fds
+
+    if not hasattr(os, "memfd_create"):
+        pytest.skip("memfd_create is not available")
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(_output_buffer_fds()))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    for fd in seen[0]:
+        with pytest.raises(OSError):
+            os.fstat(fd)
@@ -50,12 +50,20 @@ def test_all_exports():
 
     expected = [
         "run_mojo",
+        "stream_mojo",
+        "compile_mojo",
+        "load_mojo_library",
+        "benchmark_mojo",
         "clear_cache",
         "cache_stats",
         "get_mojo_version",
         "mojo",
+        "prewarm",
         "validate_mojo_code",
         "get_validation_hint",
+        "MojoWorker",
+        "get_worker",
+        "close_all_workers",
     ]
 
     assert set(py_run_mojo.__all__) == set(expected)
@@ -0,0 +1,123 @@
+"""Tests for the persistent Mojo worker."""
+
+from pathlib import Path
+
+WORKER_SOURCE = Path(__file__).parent.parent / "benchmarks" / "worker.mojo"
+
+ECHO_WORKER = """
+fn main() raises:
+    while True:
+        var line: String
+        try:
+            line = input()
+        except:
+            break
+        print(atol(line) * 2, flush=True)
+"""
+
+
+def test_worker_round_trips():
+    """Test that one worker process answers repeated requests."""
+    from py_run_mojo import MojoWorker
+
+    with MojoWorker(ECHO_WORKER) as worker:
+        pid = worker._process.pid
+        assert worker.call(21) == "42"
+        assert worker.call(5) == "10"
+        assert worker._process.pid == pid
+
+    assert not worker.running
+
+
+def test_worker_restarts_after_close():
+    """Test that a closed worker is restarted lazily on the next call."""
+    from py_run_mojo import MojoWorker
+
+    worker = MojoWorker(ECHO_WORKER)
+    assert worker.call(1) == "2"
+    worker.close()
+    assert worker.call(2) == "4"
+    worker.close()
+
+
+def test_benchmark_worker_dispatch():
+    """Test the benchmark worker's function dispatch."""
+    from py_run_mojo import MojoWorker
+
+    with MojoWorker(str(WORKER_SOURCE)) as worker:
+        assert worker.call("fibonacci", 10) == "55"
+        assert worker.call("sum_squares", 10) == "385"
+        assert worker.call("is_prime", 17) == "True"
+        assert worker.call("gcd", 48, 18) == "6"
+        assert worker.call("count_primes", 100) == "25"
+
+
+def test_benchmark_worker_survives_bad_requests():
+    """Test that a malformed request gets an error line, not a dead worker."""
+    from py_run_mojo import MojoWorker
+
+    with MojoWorker(str(WORKER_SOURCE)) as worker:
+        pid = worker._process.pid
+        assert worker.call().startswith("error:")  # Blank line
+        assert worker.call("fibonacci").startswith("error:")
+        assert worker.call("fibonacci", "ten").startswith("error:")
+        assert worker.call("gcd", 48).startswith("error:")
+        assert worker.call("nope", 1).startswith("error:")
+        assert worker.call("fibonacci", 10) == "55"
+        assert worker._process.pid == pid
+
+
+def test_worker_compile_failure():
+    """Test that an invalid worker program yields None instead of raising."""
+    from py_run_mojo import MojoWorker
+
+    worker = MojoWorker("fn main():\n    undefined_function()\n")
+    assert worker.call(1) is None
+    assert not worker.running
+
+
+def test_get_worker_is_shared():
+    """Test that get_worker reuses one process per program."""
+    from py_run_mojo import close_all_workers, get_worker
+
+    worker = get_worker(ECHO_WORKER)
+    assert get_worker(ECHO_WORKER) is worker
+    assert worker.call(4) == "8"
+
+    close_all_workers()
+    assert not worker.running
+    assert get_worker(ECHO_WORKER) is not worker
+
+
+def test_worker_program_one_shot_mode():
+    """Test that the benchmark worker also dispatches a single argv request."""
+    from py_run_mojo import run_mojo
+
+    assert run_mojo(str(WORKER_SOURCE), extra_args=["fibonacci", "10"]) == "55"
+    assert run_mojo(str(WORKER_SOURCE), extra_args=["gcd", "48", "18"]) == "6"
+
+    # A missing operand is an error, not a fall-through into worker mode
+    assert run_mojo(str(WORKER_SOURCE), extra_args=["fibonacci"]) is None
+
+
+def test_worker_is_thread_safe():
+    """Test that concurrent calls on one worker each get their own response."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from py_run_mojo import MojoWorker
+
+    with MojoWorker(ECHO_WORKER) as worker, ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker.call, range(100)))
+
+    assert results == [str(n * 2) for n in range(100)]
+
+
+def test_worker_call_many():
+    """Test that pipelined requests come back in order from one process."""
+    from py_run_mojo import MojoWorker
+
+    with MojoWorker(ECHO_WORKER) as worker:
+        pid = worker._process.pid
+        assert worker.call_many([(n,) for n in range(1000)]) == [str(n * 2) for n in range(1000)]
+        assert worker.call_many([]) == []
+        assert worker._process.pid == pid